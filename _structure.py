@@ -0,0 +1,73 @@
+"""
+Helper untuk mengekstrak struktur (keys only) dari JSON response
+
+Module ini bisa di-compile menjadi C extension dengan mypyc:
+    pip install mypy
+    mypyc _structure.py
+Jika hasil compile (.so/.pyd) ada, Python otomatis memakainya; jika tidak,
+versi pure-Python ini yang dipakai tanpa perubahan di pemanggil.
+"""
+from typing import Any, Dict, List, Tuple
+
+_CONTAINER_TYPES = (dict, list)
+
+
+def extract_keys_only(data: Any) -> Any:
+    """
+    Extract hanya keys dari JSON response (structure only, no values)
+    Process dict, list, dan nested structures secara iteratif dengan stack
+    (tanpa rekursi, aman untuk response yang sangat dalam)
+
+    Contoh:
+    Input: {"data": {"id": "123", "name": "John", "attrs": {"age": 30}}}
+    Output: {"data": {"id": None, "name": None, "attrs": {"age": None}}}
+    """
+    result: Any
+    if isinstance(data, dict):
+        # Fast path untuk root yang flat (semua value primitive): isi key
+        # sekaligus di level C. Scan berhenti di container pertama, jadi
+        # response bertingkat ({"data": ...}) hanya membayar satu cek
+        for value in data.values():
+            if isinstance(value, _CONTAINER_TYPES):
+                break
+        else:
+            return dict.fromkeys(data)
+        result = {}
+    elif isinstance(data, list):
+        result = []
+    else:
+        # Primitive value (string, number, boolean, null)
+        return None
+
+    # Stack berisi (source, target): target adalah container kosong yang
+    # sudah terpasang di parent dan akan diisi dari source
+    stack: List[Tuple[Any, Any]] = [(data, result)]
+    while stack:
+        source, target = stack.pop()
+        if isinstance(source, dict):
+            for key, value in source.items():
+                if isinstance(value, dict):
+                    child_dict: Dict[Any, Any] = {}
+                    target[key] = child_dict
+                    stack.append((value, child_dict))
+                elif isinstance(value, list):
+                    child_list: List[Any] = []
+                    target[key] = child_list
+                    stack.append((value, child_list))
+                else:
+                    # Primitive value (string, number, boolean, null)
+                    target[key] = None
+        elif source:
+            # Ambil struktur dari item pertama; list of primitive menjadi []
+            first_item = source[0]
+            if isinstance(first_item, dict):
+                first_dict: Dict[Any, Any] = {}
+                target.append(first_dict)
+                stack.append((first_item, first_dict))
+            elif isinstance(first_item, list):
+                first_list: List[Any] = []
+                target.append(first_list)
+                stack.append((first_item, first_list))
+
+    return result
+
@@ -1,76 +1,346 @@
 """
 Flask Web Application untuk melihat response endpoint SEVIMA API
 """
+import atexit
+import hashlib
 import json
 import os
+import pickle
 import re
-from flask import Flask, render_template, request, jsonify
+import struct
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, fields, is_dataclass
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
+from typing import Any
+from flask import Flask, Response, render_template, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from _structure import extract_keys_only
 from sevima_client import SEVIMAClient
 
+try:
+    import orjson
+except ImportError:  # orjson opsional, fallback ke stdlib json
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # ijson opsional, fallback ke full parse
+    ijson = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash opsional, fallback ke hashlib.blake2b
+    xxhash = None  # type: ignore[assignment]
+
+# Integer di luar 64-bit paling sedikit 19 digit; orjson men-decode-nya menjadi float
+_LONG_DIGITS_RE = re.compile(r'\d{19}')
+_LONG_DIGITS_BYTES_RE = re.compile(rb'\d{19}')
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider Flask berbasis orjson, dipakai oleh request.get_json(),
+    jsonify() dan filter tojson di template. Input yang ditolak orjson (UTF-8 BOM,
+    NaN/Infinity, integer di luar 64-bit) diproses provider stdlib bawaan Flask
+    """
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode('utf-8')
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, **kwargs)
+    
+    def loads(self, s, **kwargs):
+        long_digits = _LONG_DIGITS_BYTES_RE if isinstance(s, (bytes, bytearray)) else _LONG_DIGITS_RE
+        if not long_digits.search(s):
+            try:
+                return orjson.loads(s)
+            except orjson.JSONDecodeError:
+                pass
+        return super().loads(s, **kwargs)
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonJSONProvider(app)
+
+# Directory tempat script ini berada
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # Path untuk response.json
-RESPONSE_JSON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'response.json')
+RESPONSE_JSON_PATH = os.path.join(_SCRIPT_DIR, 'response.json')
+
+# Pattern path variable :variable_name atau {variable_name}
+_PATH_VAR_RE = re.compile(r':(\w+)|\{(\w+)\}')
+# Pattern path variable yang belum diganti saat test endpoint
+_UNRESOLVED_COLON_VAR_RE = re.compile(r':([a-zA-Z0-9_-]+)')
+_UNRESOLVED_BRACE_VAR_RE = re.compile(r'{([a-zA-Z0-9_-]+)}')
+
+def _read_json_file(path):
+    """Baca dan parse file JSON (orjson jika tersedia)"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
-def extract_keys_only(data):
+def _json_default(obj):
+    """Serializer tambahan untuk stdlib json (dataclass seperti Endpoint)"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _json_dumps(data):
     """
-    Extract hanya keys dari JSON response (structure only, no values)
-    Recursively process dict, list, dan nested structures
-    
-    Contoh:
-    Input: {"data": {"id": "123", "name": "John", "attrs": {"age": 30}}}
-    Output: {"data": {"id": None, "name": None, "attrs": {"age": None}}}
+    Serialisasi data ke JSON bytes (orjson jika tersedia). Data yang ditolak orjson
+    tapi valid untuk stdlib json (misalnya integer di luar 64-bit) memakai json.dumps
     """
-    if isinstance(data, dict):
-        result = {}
-        for key, value in data.items():
-            if isinstance(value, dict):
-                result[key] = extract_keys_only(value)
-            elif isinstance(value, list):
-                result[key] = extract_keys_only(value)
-            else:
-                # Primitive value (string, number, boolean, null)
-                result[key] = None
-        return result
-    elif isinstance(data, list):
-        if len(data) > 0:
-            # Ambil struktur dari item pertama
-            first_item = extract_keys_only(data[0])
-            return [first_item] if first_item is not None else []
-        else:
-            # Empty list
-            return []
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+def _write_json_file(path, data):
+    """Tulis data ke file JSON dengan indent 2 (orjson jika tersedia)"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     else:
-        # Primitive value (string, number, boolean, null)
-        return None
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+def _structure_hash(structure):
+    """Fingerprint 64-bit struktur response (xxhash jika tersedia, selain itu blake2b)"""
+    if orjson is not None:
+        data = orjson.dumps(structure, option=orjson.OPT_SORT_KEYS)
+    else:
+        data = json.dumps(structure, sort_keys=True).encode('utf-8')
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+def _load_responses():
+    """Load isi response.json (dict kosong jika belum ada / tidak valid)"""
+    if os.path.exists(RESPONSE_JSON_PATH):
+        try:
+            return _read_json_file(RESPONSE_JSON_PATH)
+        except:
+            pass
+    return {}
+
+def _responses_mtime_ns():
+    """mtime response.json dalam nanosecond (0 jika belum ada)"""
+    try:
+        return os.stat(RESPONSE_JSON_PATH).st_mtime_ns
+    except OSError:
+        return 0
+
+# Isi response.json disimpan di memory; file ditulis oleh background thread
+_RESPONSES = _load_responses()
+# Versi isi _RESPONSES (awalnya mtime file, naik setiap ada update), dipakai sebagai ETag
+_responses_version = _responses_mtime_ns()
+# Cache body /api/documentation: (version, body)
+_documentation_body = None
+# Hash struktur per endpoint untuk skip update yang tidak mengubah apa pun
+_structure_hashes = {path: _structure_hash(saved) for path, saved in _RESPONSES.items()}
+_responses_lock = threading.Lock()
+_responses_dirty = threading.Event()
+_flush_lock = threading.Lock()
+_flusher_thread = None
+# Jeda (detik) sebelum flush agar update beruntun cukup ditulis sekali
+_FLUSH_DELAY = 0.25
+
+def _flush_responses():
+    """Tulis _RESPONSES ke response.json jika ada perubahan (atomic via temp file + os.replace)"""
+    with _flush_lock:
+        with _responses_lock:
+            if not _responses_dirty.is_set():
+                return
+            _responses_dirty.clear()
+            snapshot = dict(_RESPONSES)
+        
+        tmp_path = f"{RESPONSE_JSON_PATH}.{os.getpid()}.tmp"
+        try:
+            _write_json_file(tmp_path, snapshot)
+            os.replace(tmp_path, RESPONSE_JSON_PATH)
+        except Exception as e:
+            print(f"❌ Error saving response structure: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+def _flusher():
+    """Background thread: tunggu perubahan lalu flush ke response.json"""
+    while True:
+        _responses_dirty.wait()
+        time.sleep(_FLUSH_DELAY)
+        _flush_responses()
+
+def _schedule_flush():
+    """Tandai _RESPONSES berubah dan pastikan flusher thread berjalan"""
+    global _flusher_thread
+    with _responses_lock:
+        _responses_dirty.set()
+        if _flusher_thread is None:
+            _flusher_thread = threading.Thread(target=_flusher, name='response-json-flusher', daemon=True)
+            _flusher_thread.start()
+
+# Pastikan perubahan terakhir tetap tertulis saat proses berhenti
+atexit.register(_flush_responses)
 
 def save_response_structure(endpoint_path, response_data):
     """
     Simpan struktur response ke response.json
     Endpoint path sebagai key, struktur response sebagai value
+    Update dilakukan di memory; file ditulis oleh background thread
     """
-    # Load existing responses
-    responses = {}
-    if os.path.exists(RESPONSE_JSON_PATH):
-        try:
-            with open(RESPONSE_JSON_PATH, 'r', encoding='utf-8') as f:
-                responses = json.load(f)
-        except:
-            responses = {}
+    global _responses_version
     
     # Extract hanya keys dari response
     structure = extract_keys_only(response_data)
+    structure_hash = _structure_hash(structure)
+    
+    with _responses_lock:
+        if _structure_hashes.get(endpoint_path) == structure_hash:
+            return
+        # Simpan dengan endpoint path sebagai key
+        _RESPONSES[endpoint_path] = structure
+        _structure_hashes[endpoint_path] = structure_hash
+        _responses_version = max(time.time_ns(), _responses_version + 1)
+    
+    _schedule_flush()
+    print(f"✅ Response structure saved for endpoint: {endpoint_path}")
+
+def _iter_collection_items(f):
+    """
+    Iterasi item top-level dari Postman collection.
+    Jika ijson tersedia, item di-parse secara streaming tanpa memuat seluruh
+    JSON tree ke memory.
+    """
+    if ijson is not None:
+        return ijson.items(f, 'item.item', use_float=True)
+    raw = f.read()
+    collection = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return collection.get('item', [])
+
+@dataclass(slots=True)
+class Endpoint:
+    """Data satu endpoint dari Postman collection"""
+    name: str
+    method: str
+    path: str
+    display_path: str
+    category: str
+    query_params: tuple
+    body: Any
+    path_vars: tuple
+    description: str
+
+_ENDPOINT_FIELDS = tuple(field.name for field in fields(Endpoint))
+
+def _build_endpoint(item, category):
+    """Buat data endpoint dari satu request item Postman collection"""
+    req = item.get('request', {})
+    method = req.get('method', 'GET')
+    url_obj = req.get('url', {})
     
-    # Simpan dengan endpoint path sebagai key
-    responses[endpoint_path] = structure
+    # Get path
+    if isinstance(url_obj.get('path'), list):
+        path = '/'.join(url_obj.get('path', []))
+    else:
+        path = url_obj.get('path', '')
+    
+    # Replace path variables (:id) dengan {id} untuk display
+    display_path = path.replace(':id', '{id}')
+    
+    # Get query parameters
+    query_params = []
+    if 'query' in url_obj and url_obj['query']:
+        for q in url_obj['query']:
+            if q.get('key'):
+                query_params.append(q.get('key'))
+    
+    # Get body untuk POST/PUT
+    body = None
+    if req.get('body'):
+        body_obj = req.get('body', {})
+        if body_obj.get('mode') == 'raw' and body_obj.get('raw'):
+            try:
+                body = json.loads(body_obj.get('raw', '{}'))
+            except:
+                body = body_obj.get('raw', '')
     
-    # Save ke file
+    # Get path variables
+    path_vars = []
+    if 'variable' in url_obj:
+        for var in url_obj['variable']:
+            if var.get('key'):
+                path_vars.append(var.get('key'))
+    
+    # Jika tidak ada di variable, extract dari path (untuk pattern :id, {id}, dll)
+    if not path_vars:
+        # Extract pattern :variable_name atau {variable_name}
+        pattern_matches = _PATH_VAR_RE.findall(path)
+        for match in pattern_matches:
+            var_name = match[0] if match[0] else match[1]
+            if var_name and var_name not in path_vars:
+                path_vars.append(var_name)
+    
+    return Endpoint(
+        name=item.get('name', ''),
+        # Intern string yang banyak berulang agar perbandingan saat sort lebih cepat
+        method=sys.intern(method),
+        path=path,
+        display_path=display_path,
+        category=sys.intern(category),
+        query_params=tuple(query_params),
+        body=body,
+        path_vars=tuple(path_vars),
+        description=item.get('description', '')
+    )
+
+# Header cache endpoint: versi format, mtime_ns dan size file collection
+_ENDPOINTS_CACHE_VERSION = 2
+_ENDPOINTS_CACHE_HEADER = struct.Struct('<Iqq')
+
+def _read_endpoints_cache(cache_path, header):
+    """Load endpoints dari cache pickle jika header cocok, selain itu None"""
     try:
-        with open(RESPONSE_JSON_PATH, 'w', encoding='utf-8') as f:
-            json.dump(responses, f, indent=2, ensure_ascii=False)
-        print(f"✅ Response structure saved for endpoint: {endpoint_path}")
+        with open(cache_path, 'rb') as f:
+            if f.read(_ENDPOINTS_CACHE_HEADER.size) != header:
+                return None
+            rows = pickle.load(f)
+        return [Endpoint(*row) for row in rows]
+    except Exception:
+        return None
+
+def _write_endpoints_cache(cache_path, header, endpoints):
+    """Simpan endpoints ke cache pickle (atomic via temp file + os.replace)"""
+    # Simpan sebagai tuple field agar cache tidak bergantung pada nama module Endpoint
+    rows = [tuple(getattr(endpoint, name) for name in _ENDPOINT_FIELDS) for endpoint in endpoints]
+    # Nama temp file unik per thread: beberapa request bisa load endpoints bersamaan saat cold start
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            pickle.dump(rows, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
     except Exception as e:
-        print(f"❌ Error saving response structure: {e}")
+        print(f"Error writing endpoints cache: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
 
 # Load Postman collection
 def load_endpoints():
@@ -78,105 +348,83 @@ def load_endpoints():
     endpoints = []
     
     try:
-        # Get the directory where this script is located
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        json_path = os.path.join(script_dir, 'api_sevima_platform.json')
-        
-        with open(json_path, 'r', encoding='utf-8') as f:
-            collection = json.load(f)
+        json_path = os.path.join(_SCRIPT_DIR, 'api_sevima_platform.json')
         
-        def extract_endpoints(items, category="", subcategory=""):
-            """Recursively extract endpoints from Postman collection"""
-            for item in items:
-                if 'item' in item:
-                    # Ini adalah folder/kategori
-                    name = item.get('name', '')
-                    if category:
-                        new_category = f"{category} > {name}"
-                    else:
-                        new_category = name
-                    extract_endpoints(item['item'], new_category, subcategory)
-                elif 'request' in item:
-                    # Ini adalah endpoint
-                    req = item.get('request', {})
-                    method = req.get('method', 'GET')
-                    url_obj = req.get('url', {})
-                    
-                    # Get path
-                    if isinstance(url_obj.get('path'), list):
-                        path = '/'.join(url_obj.get('path', []))
-                    else:
-                        path = url_obj.get('path', '')
-                    
-                    # Replace path variables (:id) dengan {id} untuk display
-                    display_path = path.replace(':id', '{id}')
-                    
-                    # Get query parameters
-                    query_params = []
-                    if 'query' in url_obj and url_obj['query']:
-                        for q in url_obj['query']:
-                            if q.get('key'):
-                                query_params.append(q.get('key'))
-                    
-                    # Get body untuk POST/PUT
-                    body = None
-                    if req.get('body'):
-                        body_obj = req.get('body', {})
-                        if body_obj.get('mode') == 'raw' and body_obj.get('raw'):
-                            try:
-                                body = json.loads(body_obj.get('raw', '{}'))
-                            except:
-                                body = body_obj.get('raw', '')
-                    
-                    # Get path variables
-                    path_vars = []
-                    if 'variable' in url_obj:
-                        for var in url_obj['variable']:
-                            if var.get('key'):
-                                path_vars.append(var.get('key'))
-                    
-                    # Jika tidak ada di variable, extract dari path (untuk pattern :id, {id}, dll)
-                    if not path_vars:
-                        # Extract pattern :variable_name atau {variable_name}
-                        pattern_matches = re.findall(r':(\w+)|{(\w+)}', path)
-                        for match in pattern_matches:
-                            var_name = match[0] if match[0] else match[1]
-                            if var_name and var_name not in path_vars:
-                                path_vars.append(var_name)
-                    
-                    # Pastikan path_vars selalu berupa list yang valid
-                    if not isinstance(path_vars, list):
-                        path_vars = []
-                    
-                    # Pastikan query_params selalu berupa list yang valid
-                    if not isinstance(query_params, list):
-                        query_params = []
-                    
-                    endpoints.append({
-                        'name': item.get('name', ''),
-                        'method': method,
-                        'path': path,
-                        'display_path': display_path,
-                        'category': category,
-                        'query_params': query_params,
-                        'body': body,
-                        'path_vars': path_vars if path_vars else [],  # Pastikan selalu list, bukan None
-                        'description': item.get('description', '')
-                    })
+        # Gunakan hasil parse sebelumnya jika collection tidak berubah
+        stat = os.stat(json_path)
+        cache_path = json_path + '.cache'
+        cache_header = _ENDPOINTS_CACHE_HEADER.pack(_ENDPOINTS_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+        cached = _read_endpoints_cache(cache_path, cache_header)
+        if cached is not None:
+            return cached
         
-        if 'item' in collection:
-            extract_endpoints(collection['item'])
+        with open(json_path, 'rb') as f:
+            for top_item in _iter_collection_items(f):
+                # Traverse folder secara iteratif dengan stack (item, category)
+                stack = [(top_item, "")]
+                while stack:
+                    item, category = stack.pop()
+                    if 'item' in item:
+                        # Ini adalah folder/kategori
+                        name = item.get('name', '')
+                        if category:
+                            new_category = f"{category} > {name}"
+                        else:
+                            new_category = name
+                        # Push terbalik agar urutan child tetap sama seperti di collection
+                        stack.extend((child, new_category) for child in reversed(item['item']))
+                    elif 'request' in item:
+                        # Ini adalah endpoint
+                        endpoints.append(_build_endpoint(item, category))
         
         # Sort endpoints by category and method
-        endpoints.sort(key=lambda x: (x['category'], x['method'], x['path']))
+        endpoints.sort(key=attrgetter('category', 'method', 'path'))
+        
+        _write_endpoints_cache(cache_path, cache_header, endpoints)
         
     except Exception as e:
         print(f"Error loading endpoints: {e}")
     
     return endpoints
 
-# Cache endpoints
-ENDPOINTS = load_endpoints()
+def _group_by_category(endpoints):
+    """
+    Group endpoints by category (tanpa kategori masuk ke 'Lainnya')
+    Endpoints sudah terurut per category, jadi tiap category berupa satu blok
+    berurutan yang bisa diambil sekaligus tanpa lookup dict per endpoint
+    """
+    categories = {}
+    for cat, group in groupby(endpoints, key=attrgetter('category')):
+        categories.setdefault(cat or 'Lainnya', []).extend(group)
+    return categories
+
+# Endpoints di-load saat pertama dibutuhkan (bukan saat import) lalu di-cache;
+# data turunan di bawah juga dihitung sekali karena endpoints tidak berubah.
+# Setelah di-load semuanya read-only sehingga aman dibaca dari banyak thread
+@lru_cache(maxsize=None)
+def get_endpoints():
+    """Get list endpoint dari Postman collection (cached)"""
+    return load_endpoints()
+
+@lru_cache(maxsize=None)
+def _get_categories():
+    """Get endpoints yang sudah di-group per category (cached)"""
+    return _group_by_category(get_endpoints())
+
+@lru_cache(maxsize=None)
+def _get_endpoints_json():
+    """Get body JSON dan ETag untuk /api/endpoints (cached)"""
+    body = _json_dumps(get_endpoints())
+    return body, hashlib.blake2b(body, digest_size=8).hexdigest()
+
+def __getattr__(name):
+    # Kompatibilitas: app.ENDPOINTS tetap tersedia, di-load saat diakses
+    if name == 'ENDPOINTS':
+        return get_endpoints()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Cache HTML halaman index: (body, etag), dirender sekali pada request pertama
+_index_page = None
 
 def get_client():
     """Get SEVIMA client instance"""
@@ -188,38 +436,57 @@ def get_client():
 @app.route('/')
 def index():
     """Home page - tampilkan daftar semua endpoint"""
-    # Group endpoints by category
-    categories = {}
-    for endpoint in ENDPOINTS:
-        cat = endpoint['category'] or 'Lainnya'
-        if cat not in categories:
-            categories[cat] = []
-        categories[cat].append(endpoint)
+    global _index_page
+    # Template hanya bergantung pada endpoints; render ulang hanya jika auto reload aktif (debug)
+    if _index_page is None or app.jinja_env.auto_reload:
+        body = render_template('index.html', categories=_get_categories(), total=len(get_endpoints())).encode('utf-8')
+        _index_page = (body, hashlib.blake2b(body, digest_size=8).hexdigest())
     
-    return render_template('index.html', categories=categories, total=len(ENDPOINTS))
+    body, etag = _index_page
+    response = Response(body, mimetype='text/html')
+    response.set_etag(etag)
+    return response.make_conditional(request)
 
 @app.route('/api/endpoints')
 def api_endpoints():
     """API endpoint untuk mendapatkan list endpoint"""
-    return jsonify(ENDPOINTS)
+    body, etag = _get_endpoints_json()
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 300
+    return response.make_conditional(request)
 
 @app.route('/api/documentation')
 def api_documentation():
     """API endpoint untuk mendapatkan dokumentasi response"""
+    global _documentation_body
     try:
-        if os.path.exists(RESPONSE_JSON_PATH):
-            with open(RESPONSE_JSON_PATH, 'r', encoding='utf-8') as f:
-                documentation = json.load(f)
-            return jsonify({
-                'success': True,
-                'documentation': documentation
-            })
+        with _responses_lock:
+            version = _responses_version
+            cached = _documentation_body
+            documentation = dict(_RESPONSES) if cached is None or cached[0] != version else None
+        
+        # Serialize ulang hanya jika dokumentasi berubah sejak request sebelumnya
+        if documentation is None:
+            body = cached[1]
         else:
-            return jsonify({
-                'success': True,
-                'documentation': {},
-                'message': 'Belum ada dokumentasi. Test beberapa endpoint terlebih dahulu.'
-            })
+            if documentation:
+                body = _json_dumps({
+                    'success': True,
+                    'documentation': documentation
+                })
+            else:
+                body = _json_dumps({
+                    'success': True,
+                    'documentation': {},
+                    'message': 'Belum ada dokumentasi. Test beberapa endpoint terlebih dahulu.'
+                })
+            _documentation_body = (version, body)
+        
+        response = Response(body, mimetype='application/json')
+        response.set_etag(f'{version:x}', weak=True)
+        return response.make_conditional(request)
     except Exception as e:
         return jsonify({
             'success': False,
@@ -231,6 +498,28 @@ def documentation_page():
     """Halaman dokumentasi response"""
     return render_template('documentation.html')
 
+@lru_cache(maxsize=256)
+def _path_params_pattern(keys):
+    """
+    Compile regex yang mengganti :key dan {key} untuk semua keys sekaligus
+    Key terpanjang dicoba lebih dulu agar :id tidak memotong :id_prodi
+    """
+    alternatives = '|'.join(re.escape(key) for key in sorted(keys, key=len, reverse=True))
+    return re.compile(f':({alternatives})|\\{{({alternatives})\\}}')
+
+def _test_result_chunks(response, endpoint, method):
+    """
+    Encode body sukses /api/test sebagai potongan JSON (prefix, response, suffix)
+    agar response besar tidak perlu disalin lagi ke satu buffer envelope.
+    Encode dilakukan langsung (bukan di generator) supaya error serialisasi masih
+    tertangkap try/except di view, sebelum header 200 terkirim.
+    """
+    return (
+        b'{"success":true,"response":',
+        _json_dumps(response),
+        b',"endpoint":' + _json_dumps(endpoint) + b',"method":' + _json_dumps(method) + b'}',
+    )
+
 @app.route('/api/test', methods=['POST'])
 def test_endpoint():
     """Test endpoint dan return response"""
@@ -242,19 +531,18 @@ def test_endpoint():
         query_params = data.get('query_params', {})
         body_data = data.get('body', {})
         
-        # Replace path variables (hanya jika ada value)
+        # Replace path variables (hanya jika ada value) dalam satu pass
+        values = {key: value.strip() for key, value in path_params.items() if value and value.strip()}
         actual_path = endpoint_path
-        for key, value in path_params.items():
-            if value and value.strip():  # Hanya replace jika ada value
-                actual_path = actual_path.replace(f':{key}', value.strip())
-                actual_path = actual_path.replace(f'{{{key}}}', value.strip())
+        if values:
+            pattern = _path_params_pattern(tuple(sorted(values)))
+            actual_path = pattern.sub(lambda m: values[m.group(1) or m.group(2)], endpoint_path)
 
         # If there are still unreplaced path variables (like :id or {id}), return clear error
-        import re
         missing_vars = set()
-        for match in re.findall(r':([a-zA-Z0-9_-]+)', actual_path):
+        for match in _UNRESOLVED_COLON_VAR_RE.findall(actual_path):
             missing_vars.add(match)
-        for match in re.findall(r'{([a-zA-Z0-9_-]+)}', actual_path):
+        for match in _UNRESOLVED_BRACE_VAR_RE.findall(actual_path):
             missing_vars.add(match)
 
         if missing_vars:
@@ -308,12 +596,8 @@ def test_endpoint():
             if response:
                 save_response_structure(actual_path, response)
             
-            return jsonify({
-                'success': True,
-                'response': response,
-                'endpoint': actual_path,
-                'method': method
-            }), 200
+            chunks = _test_result_chunks(response, actual_path, method)
+            return Response(chunks, mimetype='application/json')
         
         except Exception as e:
             import traceback
@@ -349,6 +633,7 @@ def test_endpoint():
         }), 500
 
 if __name__ == '__main__':
-    print(f"Total endpoints loaded: {len(ENDPOINTS)}")
+    print(f"Total endpoints loaded: {len(get_endpoints())}")
     print("Starting Flask server on http://localhost:5000")
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    print("Untuk production gunakan WSGI server, contoh: gunicorn -k gthread -w 1 --threads 16 app:app")
+    app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
@@ -4,25 +4,431 @@ SEVIMA API Platform Python Client
 Client untuk mengakses SEVIMA API Platform menggunakan format JSON API.
 """
 
+import asyncio
+import hashlib
+import importlib.util
 import os
+import re
+import sys
+import threading
+import time
 import requests
-from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, AsyncIterator, Awaitable, Iterator, List, Sequence, Tuple, Union
 from dotenv import load_dotenv
 
+try:
+    import httpx
+except ImportError:  # httpx opsional, hanya dibutuhkan oleh AsyncSEVIMAClient
+    httpx = None  # type: ignore[assignment]
+
+try:
+    import requests_cache
+except ImportError:  # requests-cache opsional, hanya dibutuhkan jika cache=True
+    requests_cache = None  # type: ignore[assignment]
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # ijson opsional, stream_items fallback ke full parse
+    ijson = None
+
+import json as _json
+
+try:
+    import orjson
+except ImportError:  # orjson opsional, fallback ke stdlib json
+    orjson = None  # type: ignore[assignment]
+
+# orjson men-decode integer di luar 64-bit menjadi float (presisi hilang). Integer 64-bit
+# paling banyak 19-20 digit, jadi body dengan deretan >= 19 digit di-decode dengan stdlib
+# json yang menjaga nilai integer persis. Scan regex ini jauh lebih murah dari decode.
+_LONG_DIGITS_RE = re.compile(rb"\d{19}")
+
+
+def _loads(content: bytes) -> Any:
+    """
+    Decode body JSON dengan orjson jika tersedia. Input yang ditolak orjson tapi valid
+    untuk stdlib json (UTF-8 BOM, literal NaN/Infinity) di-decode ulang dengan json.loads,
+    begitu juga body yang mungkin berisi integer di luar 64-bit.
+    """
+    if orjson is not None and not _LONG_DIGITS_RE.search(content):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return _json.loads(content)
+
+
+# Timeout request: detik (float) atau (connect, read)
+TimeoutType = Union[float, Tuple[float, float]]
+
+# Exception dari raise_for_status() untuk setiap transport yang didukung
+_HTTP_STATUS_ERRORS: Tuple[type, ...] = (requests.HTTPError,)
+if httpx is not None:
+    _HTTP_STATUS_ERRORS += (httpx.HTTPStatusError,)
+
 # Load environment variables
 load_dotenv()
 
+# Tabel endpoint GET: (nama method, endpoint, nama parameter ID, docstring). Endpoint
+# dengan "%s" menerima ID resource lewat parameter bernama sesuai kolom ketiga;
+# endpoint yang berakhir "%s" adalah detail (tanpa params), sisanya (list dan
+# sub-resource) menerima query params. Method get_* dibuat dari tabel ini setelah
+# class SEVIMAClient didefinisikan.
+_RESOURCES: List[Tuple[str, str, Optional[str], str]] = [
+    # ==================== DATA CBT ====================
+    ("get_soal_cbt", "siakadcloud/v1/soal-cbt", None, "Get list soal CBT"),
+    ("get_soal_cbt_by_id", "siakadcloud/v1/soal-cbt/%s", "soal_id", "Get detail soal CBT by ID"),
+    ("get_bank_soal_cbt", "siakadcloud/v1/bank-soal-cbt", None, "Get list bank soal CBT"),
+    ("get_bank_soal_cbt_by_id", "siakadcloud/v1/bank-soal-cbt/%s", "bank_id", "Get detail bank soal CBT by ID"),
+    ("get_soal_by_bank", "siakadcloud/v1/bank-soal-cbt/%s/soal", "bank_id", "Get soal dari bank soal tertentu"),
+    ("get_ujian_cbt", "siakadcloud/v1/ujian-cbt", None, "Get list ujian CBT"),
+    ("get_ujian_cbt_by_id", "siakadcloud/v1/ujian-cbt/%s", "ujian_id", "Get detail ujian CBT by ID"),
+    ("get_jadwal_ujian_cbt", "siakadcloud/v1/ujian-cbt/%s/jadwal", "ujian_id", "Get jadwal ujian CBT"),
+    ("get_peserta_ujian_cbt", "siakadcloud/v1/ujian-cbt/%s/peserta", "ujian_id", "Get peserta ujian CBT"),
+    ("get_jadwal_ujian_cbt_list", "siakadcloud/v1/jadwal-ujian-cbt", None, "Get list jadwal ujian CBT"),
+    ("get_jadwal_ujian_cbt_by_id", "siakadcloud/v1/jadwal-ujian-cbt/%s", "jadwal_id", "Get detail jadwal ujian CBT by ID"),
+    ("get_soal_ujian_cbt", "siakadcloud/v1/soal-ujian-cbt", None, "Get list soal ujian CBT"),
+    ("get_soal_ujian_cbt_by_id", "siakadcloud/v1/soal-ujian-cbt/%s", "soal_id", "Get detail soal ujian CBT by ID"),
+    ("get_peserta_ujian_cbt_list", "siakadcloud/v1/peserta-ujian-cbt", None, "Get list peserta ujian CBT"),
+    ("get_peserta_ujian_cbt_by_id", "siakadcloud/v1/peserta-ujian-cbt/%s", "peserta_id", "Get detail peserta ujian CBT by ID"),
+    ("get_jawaban_peserta_ujian_cbt", "siakadcloud/v1/jawaban-peserta-ujian-cbt", None, "Get list jawaban peserta ujian CBT"),
+    ("get_jawaban_peserta_ujian_cbt_by_id", "siakadcloud/v1/jawaban-peserta-ujian-cbt/%s", "jawaban_id", "Get detail jawaban peserta ujian CBT by ID"),
 
-class SEVIMAClient:
-    """Client untuk mengakses SEVIMA API Platform"""
+    # ==================== DATA KEPEGAWAIAN ====================
+    ("get_pegawai", "siakadcloud/v1/pegawai", None, "Get list pegawai"),
+    ("get_pegawai_by_id", "siakadcloud/v1/pegawai/%s", "pegawai_id", "Get detail pegawai by ID"),
+    ("get_pegawai_cuti", "siakadcloud/v1/pegawai/%s/cuti", "pegawai_id", "Get cuti pegawai"),
+    ("get_pegawai_izin", "siakadcloud/v1/pegawai/%s/izin", "pegawai_id", "Get izin pegawai"),
+    ("get_presensi_dosen", "siakadcloud/v1/presensi-dosen", None, "Get list presensi dosen"),
+    ("get_presensi_dosen_by_id", "siakadcloud/v1/presensi-dosen/%s", "presensi_id", "Get detail presensi dosen by ID"),
+    ("get_dosen", "siakadcloud/v1/dosen", None, "Get list dosen"),
+    ("get_dosen_by_id", "siakadcloud/v1/dosen/%s", "dosen_id", "Get detail dosen by ID"),
+    ("get_dosen_penelitian", "siakadcloud/v1/dosen/%s/penelitian", "dosen_id", "Get penelitian dosen"),
+    ("get_dosen_edom", "siakadcloud/v1/dosen/%s/edom", "dosen_id", "Get evaluasi dosen oleh mahasiswa (EDOM)"),
+    ("get_dosen_perwalian", "siakadcloud/v1/dosen/%s/perwalian", "dosen_id", "Get perwalian dosen"),
+    ("get_dosen_kelas", "siakadcloud/v1/dosen/%s/kelas", "dosen_id", "Get kelas dosen"),
+    ("get_dosen_jadwal", "siakadcloud/v1/dosen/%s/jadwal", "dosen_id", "Get jadwal dosen"),
+    ("get_dosen_presensi", "siakadcloud/v1/dosen/%s/presensi-dosen", "dosen_id", "Get presensi dosen"),
+    ("get_dosen_pengabdian", "siakadcloud/v1/dosen/%s/pengabdian", "dosen_id", "Get pengabdian dosen"),
+    ("get_dosen_cuti", "siakadcloud/v1/dosen/%s/cuti", "dosen_id", "Get cuti dosen"),
+    ("get_dosen_izin", "siakadcloud/v1/dosen/%s/izin", "dosen_id", "Get izin dosen"),
+    ("get_dosen_publikasi", "siakadcloud/v1/dosen/%s/publikasi", "dosen_id", "Get publikasi dosen"),
+    ("get_dosen_paten", "siakadcloud/v1/dosen/%s/paten", "dosen_id", "Get paten dosen"),
+
+    # ==================== RIWAYAT PENELITIAN ====================
+    ("get_penelitian", "siakadcloud/v1/penelitian", None, "Get list penelitian"),
+    ("get_penelitian_by_id", "siakadcloud/v1/penelitian/%s", "penelitian_id", "Get detail penelitian by ID"),
+    ("get_dokumen_penelitian", "siakadcloud/v1/penelitian/%s/dokumen-penelitian", "penelitian_id", "Get dokumen penelitian"),
+    ("get_dosen_penelitian_by_id", "siakadcloud/v1/penelitian/%s/dosen", "penelitian_id", "Get dosen yang terlibat dalam penelitian"),
+    ("get_paten", "siakadcloud/v1/paten", None, "Get list paten"),
+    ("get_paten_by_id", "siakadcloud/v1/paten/%s", "paten_id", "Get detail paten by ID"),
+    ("get_dokumen_paten", "siakadcloud/v1/paten/%s/dokumen-paten", "paten_id", "Get dokumen paten"),
+    ("get_dosen_paten_by_id", "siakadcloud/v1/paten/%s/dosen", "paten_id", "Get dosen yang terlibat dalam paten"),
+    ("get_dokumen_paten_list", "siakadcloud/v1/dokumen-paten", None, "Get list dokumen paten"),
+    ("get_dokumen_paten_by_id", "siakadcloud/v1/dokumen-paten/%s", "dokumen_id", "Get detail dokumen paten by ID"),
+    ("get_publikasi", "siakadcloud/v1/publikasi", None, "Get list publikasi"),
+    ("get_publikasi_by_id", "siakadcloud/v1/publikasi/%s", "publikasi_id", "Get detail publikasi by ID"),
+    ("get_dokumen_publikasi", "siakadcloud/v1/publikasi/%s/dokumen-publikasi", "publikasi_id", "Get dokumen publikasi"),
+    ("get_dosen_publikasi_by_id", "siakadcloud/v1/publikasi/%s/dosen", "publikasi_id", "Get dosen yang terlibat dalam publikasi"),
+    ("get_dokumen_publikasi_list", "siakadcloud/v1/dokumen-publikasi", None, "Get list dokumen publikasi"),
+    ("get_dokumen_publikasi_by_id", "siakadcloud/v1/dokumen-publikasi/%s", "dokumen_id", "Get detail dokumen publikasi by ID"),
+
+    # ==================== RIWAYAT PENGABDIAN ====================
+    ("get_pengabdian", "siakadcloud/v1/pengabdian", None, "Get list pengabdian"),
+    ("get_pengabdian_by_id", "siakadcloud/v1/pengabdian/%s", "pengabdian_id", "Get detail pengabdian by ID"),
+    ("get_dokumen_pengabdian", "siakadcloud/v1/pengabdian/%s/dokumen-pengabdian", "pengabdian_id", "Get dokumen pengabdian"),
+    ("get_dokumen_pengabdian_list", "siakadcloud/v1/dokumen-pengabdian", None, "Get list dokumen pengabdian"),
+    ("get_dokumen_pengabdian_by_id", "siakadcloud/v1/dokumen-pengabdian/%s", "dokumen_id", "Get detail dokumen pengabdian by ID"),
+
+    # ==================== DATA KEUANGAN ====================
+    ("get_invoice", "siakadcloud/v1/invoice", None, "Get list invoice"),
+    ("get_invoice_by_id", "siakadcloud/v1/invoice/%s", "invoice_id", "Get detail invoice by ID"),
+    ("get_pembayaran", "siakadcloud/v1/pembayaran", None, "Get list pembayaran"),
+    ("get_pembayaran_by_id", "siakadcloud/v1/pembayaran/%s", "pembayaran_id", "Get detail pembayaran by ID"),
+
+    # ==================== DATA LAINNYA ====================
+    ("get_konsentrasi", "siakadcloud/v1/konsentrasi", None, "Get list konsentrasi"),
+    ("get_konsentrasi_by_id", "siakadcloud/v1/konsentrasi/%s", "konsentrasi_id", "Get detail konsentrasi by ID"),
+    ("get_program_studi_by_konsentrasi", "siakadcloud/v1/konsentrasi/%s/program-studi", "konsentrasi_id", "Get program studi dari konsentrasi"),
+    ("get_berkas_syarat_pendaftar", "siakadcloud/v1/berkas-syarat-pendaftar", None, "Get list berkas syarat pendaftar"),
+    ("get_berkas_syarat_pendaftar_by_id", "siakadcloud/v1/berkas-syarat-pendaftar/%s", "berkas_id", "Get detail berkas syarat pendaftar by ID"),
+    ("get_dokumen_penelitian_list", "siakadcloud/v1/dokumen-penelitian", None, "Get list dokumen penelitian"),
+    ("get_dokumen_penelitian_by_id", "siakadcloud/v1/dokumen-penelitian/%s", "dokumen_id", "Get detail dokumen penelitian by ID"),
+
+    # ==================== EDLink ====================
+    ("get_bahan_ajar", "edlink/v1/bahan-ajar", None, "Get list bahan ajar (EdLink)"),
+    ("get_bahan_ajar_by_id", "edlink/v1/bahan-ajar/%s", "bahan_id", "Get detail bahan ajar by ID"),
+    ("get_kelas_edlink", "edlink/v1/kelas", None, "Get list kelas (EdLink)"),
+    ("get_kelas_edlink_by_id", "edlink/v1/kelas/%s", "kelas_id", "Get detail kelas by ID"),
+    ("get_sesi", "edlink/v1/sesi", None, "Get list sesi (EdLink)"),
+    ("get_sesi_by_id", "edlink/v1/sesi/%s", "sesi_id", "Get detail sesi by ID"),
+    ("get_pengajar_kelas", "edlink/v1/pengajar-kelas", None, "Get list pengajar kelas (EdLink)"),
+    ("get_pengajar_kelas_by_id", "edlink/v1/pengajar-kelas/%s", "pengajar_id", "Get detail pengajar kelas by ID"),
+    ("get_peserta_kelas", "edlink/v1/peserta-kelas", None, "Get list peserta kelas (EdLink)"),
+    ("get_peserta_kelas_by_id", "edlink/v1/peserta-kelas/%s", "peserta_id", "Get detail peserta kelas by ID"),
+    ("get_presensi_kelas", "edlink/v1/presensi-kelas", None, "Get list presensi kelas (EdLink)"),
+    ("get_presensi_kelas_by_id", "edlink/v1/presensi-kelas/%s", "presensi_id", "Get detail presensi kelas by ID"),
+    ("get_tugas", "edlink/v1/tugas", None, "Get list tugas (EdLink)"),
+    ("get_tugas_by_id", "edlink/v1/tugas/%s", "tugas_id", "Get detail tugas by ID"),
+    ("get_soal_edlink", "edlink/v1/soal", None, "Get list soal (EdLink)"),
+    ("get_soal_edlink_by_id", "edlink/v1/soal/%s", "soal_id", "Get detail soal by ID"),
+    ("get_peserta_kuis", "edlink/v1/peserta-kuis", None, "Get list peserta kuis (EdLink)"),
+    ("get_peserta_kuis_by_id", "edlink/v1/peserta-kuis/%s", "peserta_id", "Get detail peserta kuis by ID"),
+
+    # ==================== DATA MBKM ====================
+    ("get_mitra_mbkm", "siakadcloud/v1/mitra-mbkm", None, "Get list mitra MBKM"),
+    ("get_mitra_mbkm_by_id", "siakadcloud/v1/mitra-mbkm/%s", "mitra_id", "Get detail mitra MBKM by ID"),
+    ("get_posisi_pekerjaan_mbkm", "siakadcloud/v1/mitra-mbkm/%s/posisi-pekerjaan", "mitra_id", "Get posisi pekerjaan dari mitra MBKM"),
+    ("get_program_mbkm", "siakadcloud/v1/program-mbkm", None, "Get list program MBKM"),
+    ("get_program_mbkm_by_id", "siakadcloud/v1/program-mbkm/%s", "program_id", "Get detail program MBKM by ID"),
+    ("get_peserta_mbkm", "siakadcloud/v1/peserta-mbkm", None, "Get list peserta MBKM"),
+    ("get_peserta_mbkm_by_id", "siakadcloud/v1/peserta-mbkm/%s", "peserta_id", "Get detail peserta MBKM by ID"),
+
+    # ==================== DATA MAHASISWA ====================
+    ("get_mahasiswa", "siakadcloud/v1/mahasiswa", None, "Get list mahasiswa"),
+    ("get_mahasiswa_by_id", "siakadcloud/v1/mahasiswa/%s", "mahasiswa_id", "Get detail mahasiswa by ID"),
+    ("get_presensi_mahasiswa", "siakadcloud/v1/mahasiswa/%s/presensi", "mahasiswa_id", "Get presensi mahasiswa"),
+    ("get_nilai_mahasiswa", "siakadcloud/v1/mahasiswa/%s/nilai", "mahasiswa_id", "Get nilai mahasiswa"),
+    ("get_pelanggaran_mahasiswa", "siakadcloud/v1/pelanggaran-mahasiswa", None, "Get list pelanggaran mahasiswa"),
+    ("get_pelanggaran_mahasiswa_by_id", "siakadcloud/v1/pelanggaran-mahasiswa/%s", "pelanggaran_id", "Get detail pelanggaran mahasiswa by ID"),
+    ("get_proporsi_nilai_mahasiswa", "siakadcloud/v1/proporsi-nilai-mahasiswa", None, "Get list proporsi nilai mahasiswa"),
+    ("get_proporsi_nilai_mahasiswa_by_id", "siakadcloud/v1/proporsi-nilai-mahasiswa/%s", "proporsi_id", "Get detail proporsi nilai mahasiswa by ID"),
+    ("get_pendaftar", "siakadcloud/v1/pendaftar", None, "Get list pendaftar"),
+    ("get_pendaftar_by_id", "siakadcloud/v1/pendaftar/%s", "pendaftar_id", "Get detail pendaftar by ID"),
+    ("get_program_studi_pendaftar", "siakadcloud/v1/pendaftar/%s/program-studi-pendaftar", "pendaftar_id", "Get program studi pendaftar"),
+    ("get_seleksi_pendaftar", "siakadcloud/v1/pendaftar/%s/seleksi", "pendaftar_id", "Get seleksi pendaftar"),
+
+    # ==================== DATA AKADEMIK ====================
+    ("get_program_studi", "siakadcloud/v1/program-studi", None, "Get list program studi"),
+    ("get_program_studi_by_id", "siakadcloud/v1/program-studi/%s", "program_studi_id", "Get detail program studi by ID"),
+    ("get_mata_kuliah", "siakadcloud/v1/mata-kuliah", None, "Get list mata kuliah"),
+    ("get_mata_kuliah_by_id", "siakadcloud/v1/mata-kuliah/%s", "mata_kuliah_id", "Get detail mata kuliah by ID"),
+    ("get_kelas", "siakadcloud/v1/kelas", None, "Get list kelas"),
+    ("get_kelas_by_id", "siakadcloud/v1/kelas/%s", "kelas_id", "Get detail kelas by ID"),
+    ("get_jadwal", "siakadcloud/v1/jadwal", None, "Get list jadwal"),
+    ("get_jadwal_by_id", "siakadcloud/v1/jadwal/%s", "jadwal_id", "Get detail jadwal by ID"),
+    ("get_cpmk", "siakadcloud/v1/cpmk", None, "Get list CPMK (Capaian Pembelajaran Mata Kuliah)"),
+    ("get_cpmk_by_id", "siakadcloud/v1/cpmk/%s", "cpmk_id", "Get detail CPMK by ID"),
+]
+
+
+class _BaseSEVIMAClient:
+    """
+    Bagian yang sama untuk SEVIMAClient dan AsyncSEVIMAClient: credentials, base URL,
+    timeout, cache get_*_by_id, dan helper query params/paginasi (tanpa I/O)
+    """
     
     BASE_URL = "https://api.sevimaplatform.com"
     
+    # Batas jumlah URL yang di-cache (endpoint detail berisi ID bisa sangat banyak)
+    _URL_CACHE_MAXSIZE = 1024
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        id_cache_ttl: Optional[float] = None,
+        id_cache_maxsize: int = 10_000,
+        timeout: Optional[TimeoutType] = None
+    ):
+        api_key = api_key or os.getenv("SEVIMA_API_KEY")
+        secret_key = secret_key or os.getenv("SEVIMA_SECRET_KEY")
+        
+        if not api_key:
+            raise ValueError("API Key is required. Set SEVIMA_API_KEY environment variable or pass api_key parameter.")
+        if not secret_key:
+            raise ValueError("Secret Key is required. Set SEVIMA_SECRET_KEY environment variable or pass secret_key parameter.")
+        
+        self.api_key: str = api_key
+        self.secret_key: str = secret_key
+        self._url_cache: Dict[str, str] = {}
+        self.base_url = base_url or os.getenv("SEVIMA_BASE_URL") or self.BASE_URL
+        self.timeout = timeout or (5, 30)
+        self.id_cache_ttl = id_cache_ttl
+        self.id_cache_maxsize = id_cache_maxsize
+        # endpoint -> (waktu kedaluwarsa, response) untuk get_*_by_id
+        self._id_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._id_cache_lock = threading.Lock()
+    
+    def _default_headers(self) -> Dict[str, str]:
+        """Default headers untuk semua request"""
+        return {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "X-App-Key": self.api_key,
+            "X-Secret-Key": self.secret_key
+        }
+    
+    @staticmethod
+    def _httpx_timeout(timeout: TimeoutType):
+        """Konversi timeout gaya requests ((connect, read) atau detik) ke httpx.Timeout"""
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+    
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+    
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        # URL yang di-cache memuat base_url lama
+        self._base_url = value
+        self._url_cache.clear()
+    
+    def _url(self, endpoint: str) -> str:
+        """Full URL untuk endpoint, di-cache agar tidak digabung ulang setiap request"""
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            if len(self._url_cache) >= self._URL_CACHE_MAXSIZE:
+                self._url_cache.clear()
+            url = self._url_cache[endpoint] = f"{self.base_url}/{endpoint}"
+        return url
+    
+    @staticmethod
+    def _raise_for_status(response):
+        """Raise HTTP error dengan response_content (JSON atau text) terlampir untuk debugging"""
+        try:
+            response.raise_for_status()
+        except _HTTP_STATUS_ERRORS as e:
+            # Attach response text/json for easier debugging
+            try:
+                content = response.json()
+            except Exception:
+                content = response.text
+            e.response_content = content  # type: ignore[attr-defined]
+            raise
+    
+    def _id_cache_get(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Ambil response dari cache by ID, atau None jika tidak ada/kedaluwarsa"""
+        entry = self._id_cache.get(endpoint)
+        if entry is None:
+            return None
+        expires_at, resp = entry
+        if expires_at < time.monotonic():
+            self.cache_invalidate(endpoint)
+            return None
+        return resp
+    
+    def _id_cache_put(self, endpoint: str, resp: Dict[str, Any]):
+        """Simpan response ke cache by ID; entry tertua dibuang jika cache penuh"""
+        ttl = self.id_cache_ttl
+        if ttl is None:
+            return
+        expires_at = time.monotonic() + ttl
+        with self._id_cache_lock:
+            self._id_cache.pop(endpoint, None)
+            while self._id_cache and len(self._id_cache) >= self.id_cache_maxsize:
+                del self._id_cache[next(iter(self._id_cache))]
+            self._id_cache[endpoint] = (expires_at, resp)
+    
+    def cache_clear(self):
+        """Hapus semua cache get_*_by_id"""
+        with self._id_cache_lock:
+            self._id_cache.clear()
+    
+    def cache_invalidate(self, endpoint: str):
+        """
+        Hapus cache get_*_by_id untuk endpoint tertentu (contoh: 'siakadcloud/v1/dosen/123').
+        Dipanggil otomatis untuk setiap POST/PUT/DELETE ke endpoint yang sama.
+        """
+        if self._id_cache:
+            with self._id_cache_lock:
+                self._id_cache.pop(endpoint, None)
+    
+    def _merge_query_params(
+        self,
+        params: Optional[Dict[str, Any]] = None,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        order: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Build query params following SEVIMA conventions from info.txt."""
+        merged: Dict[str, Any] = {}
+        if params:
+            merged.update(params)
+
+        if page is not None:
+            merged['page'] = page
+        if per_page is not None:
+            merged['per_page'] = per_page
+
+        # Filters: translate {col: value} or {col: (value, operator)} -> f-{col}[(-operator)]=value
+        if filters:
+            for col, val in filters.items():
+                if isinstance(val, tuple) and len(val) == 2:
+                    value, operator = val
+                    key = f"f-{col}-{operator}"
+                    merged[key] = value
+                else:
+                    key = f"f-{col}"
+                    merged[key] = val
+
+        # Ordering: {col: 'asc'|'desc'} -> o-{col}=asc
+        if order:
+            for col, direction in order.items():
+                merged[f"o-{col}"] = direction
+
+        return merged
+
+    @staticmethod
+    def _next_page(resp: Dict[str, Any], page: int, per_page: Optional[int]) -> Optional[int]:
+        """
+        Determine the next page number from a list-style paginated response,
+        or None when the last page has been reached.
+        """
+        # Determine whether to continue
+        meta = resp.get('meta')
+        if meta:
+            current = meta.get('current_page')
+            last_page = meta.get('last_page')
+            if current is not None and last_page is not None:
+                if current >= last_page:
+                    return None
+                return (current or page) + 1
+
+        # Fallback: if urls.next exists and is truthy, continue; else stop
+        urls = resp.get('urls')
+        if urls and urls.get('next'):
+            return page + 1
+
+        # If data length is less than per_page, likely last page
+        if per_page and len(resp.get('data', [])) < per_page:
+            return None
+
+        # Safety: if we received empty data, stop
+        if not resp.get('data'):
+            return None
+
+        # Otherwise, increment page and retry
+        return page + 1
+
+
+class SEVIMAClient(_BaseSEVIMAClient):
+    """Client untuk mengakses SEVIMA API Platform"""
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
         secret_key: Optional[str] = None,
-        base_url: Optional[str] = None
+        base_url: Optional[str] = None,
+        pool_connections: int = 32,
+        pool_maxsize: int = 64,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
+        cache: bool = False,
+        cache_name: str = "sevima_cache",
+        cache_expire_after: int = 300,
+        transport: str = "requests",
+        id_cache_ttl: Optional[float] = None,
+        id_cache_maxsize: int = 10_000,
+        timeout: Optional[TimeoutType] = None
     ):
         """
         Initialize SEVIMA API Client
@@ -31,27 +437,177 @@ class SEVIMAClient:
             api_key: API Key (default: dari env SEVIMA_API_KEY)
             secret_key: Secret Key (default: dari env SEVIMA_SECRET_KEY)
             base_url: Base URL API (default: dari env SEVIMA_BASE_URL atau https://api.sevimaplatform.com)
+            pool_connections: Jumlah connection pool (per host) yang di-cache
+            pool_maxsize: Maksimum koneksi keep-alive per pool; naikkan jika client dipakai banyak thread
+            max_retries: Jumlah retry untuk error koneksi dan status 429/500/502/503/504 (0 = tanpa retry)
+            backoff_factor: Faktor exponential backoff antar retry (detik)
+            cache: Cache response GET di SQLite lokal (membutuhkan package requests-cache)
+            cache_name: Nama/path file database cache
+            cache_expire_after: Lama cache berlaku (detik) jika server tidak mengirim Cache-Control
+            transport: "requests" (default) atau "httpx" untuk httpx.Client dengan HTTP/2
+                (membutuhkan package httpx[http2]; retry hanya untuk error koneksi)
+            id_cache_ttl: Cache hasil method get_*_by_id di memory selama N detik (default: nonaktif)
+            id_cache_maxsize: Maksimum entry cache get_*_by_id
+            timeout: Default timeout request, detik atau (connect, read) (default: (5, 30))
         """
-        self.api_key = api_key or os.getenv("SEVIMA_API_KEY")
-        self.secret_key = secret_key or os.getenv("SEVIMA_SECRET_KEY")
-        self.base_url = base_url or os.getenv("SEVIMA_BASE_URL") or self.BASE_URL
-        
-        if not self.api_key:
-            raise ValueError("API Key is required. Set SEVIMA_API_KEY environment variable or pass api_key parameter.")
-        if not self.secret_key:
-            raise ValueError("Secret Key is required. Set SEVIMA_SECRET_KEY environment variable or pass secret_key parameter.")
+        super().__init__(
+            api_key=api_key,
+            secret_key=secret_key,
+            base_url=base_url,
+            id_cache_ttl=id_cache_ttl,
+            id_cache_maxsize=id_cache_maxsize,
+            timeout=timeout
+        )
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.cache = cache
+        self.cache_name = cache_name
+        self.cache_expire_after = cache_expire_after
+        self.transport = transport
+        # URL -> (snapshot session, PreparedRequest, environment settings) untuk GET tanpa params/body
+        self._prepared: Dict[str, Tuple[Tuple[Any, ...], requests.PreparedRequest, Dict[str, Any]]] = {}
         
-        self.session = requests.Session()
+        self._setup_session()
+    
+    def _setup_session(self):
+        """Buat HTTP session yang dipakai untuk semua request"""
+        if self.transport == "httpx":
+            self._setup_httpx_session()
+            return
+        if self.transport != "requests":
+            raise ValueError(f"transport harus 'requests' atau 'httpx', bukan {self.transport!r}")
+        if self.cache:
+            if requests_cache is None:
+                raise ImportError("cache=True membutuhkan requests-cache. Install dengan: pip install requests-cache")
+            self.session = requests_cache.CachedSession(
+                cache_name=self.cache_name,
+                backend="sqlite",
+                expire_after=self.cache_expire_after,
+                allowable_methods=("GET",),
+                cache_control=True,
+                stale_if_error=True,
+                # Credentials tidak disimpan di database cache, tapi hash-nya tetap jadi bagian cache key
+                ignored_parameters=["X-App-Key", "X-Secret-Key"],
+                key_fn=self._cache_key_fn()
+            )
+        else:
+            self.session = requests.Session()
         self._setup_headers()
+        self._setup_adapters()
+    
+    def _cache_key_fn(self):
+        """
+        Cache key requests-cache ditambah hash credentials, agar response milik satu
+        api_key/secret_key tidak pernah disajikan ke client dengan credentials lain.
+        """
+        credentials_hash = hashlib.blake2b(
+            f"{self.api_key}\0{self.secret_key}".encode(),
+            digest_size=16,
+            person=b"sevima-cache-key"
+        ).hexdigest()
+
+        def key_fn(request, **kwargs) -> str:
+            return f"{requests_cache.create_key(request, **kwargs)}-{credentials_hash}"
+        return key_fn
+    
+    def _setup_httpx_session(self):
+        """
+        Buat httpx.Client (HTTP/2 jika package h2 terinstall) sebagai pengganti requests.Session.
+        Dengan HTTP/2, request dari banyak thread di-multiplex di atas satu koneksi.
+        """
+        if httpx is None:
+            raise ImportError("transport='httpx' membutuhkan httpx. Install dengan: pip install 'httpx[http2]'")
+        if self.cache:
+            raise ValueError("cache=True hanya didukung dengan transport='requests'")
+        self.session = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_connections=self.pool_maxsize,
+                    max_keepalive_connections=self.pool_maxsize
+                ),
+                # httpx hanya me-retry error koneksi, bukan status 429/5xx
+                retries=self.max_retries
+            ),
+            headers=self._default_headers(),
+            follow_redirects=True,
+            timeout=self._httpx_timeout(self.timeout)
+        )
     
     def _setup_headers(self):
         """Setup default headers untuk semua request"""
-        self.session.headers.update({
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "X-App-Key": self.api_key,
-            "X-Secret-Key": self.secret_key
-        })
+        self.session.headers.update(self._default_headers())
+    
+    def _build_retry(self) -> Retry:
+        """
+        Retry policy untuk error koneksi dan status sementara (429/5xx) dengan exponential
+        backoff + jitter. Hanya method idempotent yang di-retry; header Retry-After dihormati.
+        Read timeout tidak di-retry: request yang macet gagal setelah satu kali timeout baca
+        dengan requests.ReadTimeout, bukan (max_retries + 1) kali timeout.
+        """
+        retry_kwargs: Dict[str, Any] = dict(
+            total=self.max_retries,
+            read=False,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+            respect_retry_after_header=True,
+            # Setelah retry habis, kembalikan response terakhir agar raise_for_status() tetap raise HTTPError
+            raise_on_status=False
+        )
+        try:
+            return Retry(backoff_jitter=0.3, **retry_kwargs)
+        except TypeError:
+            # urllib3 < 2.0 belum mendukung backoff_jitter
+            return Retry(**retry_kwargs)
+    
+    def _setup_adapters(self):
+        """Mount HTTPAdapter dengan connection pool yang lebih besar dan retry policy"""
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=False,
+            max_retries=self._build_retry()
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+    
+    def _session_snapshot(self) -> Tuple[Any, ...]:
+        """
+        Snapshot murah dari state session yang dipakai prepare_request/merge_environment_settings
+        (headers, auth, params, hooks, verify, cert, proxies, trust_env)
+        """
+        session = self.session
+        params = session.params
+        return (
+            tuple(session.headers.items()),
+            session.auth,
+            tuple(params.items()) if isinstance(params, dict) else params,
+            tuple((event, tuple(hooks)) for event, hooks in session.hooks.items()),
+            session.verify,
+            session.cert,
+            tuple(session.proxies.items()),
+            session.trust_env,
+        )
+    
+    def _send_prepared(self, url: str, timeout: TimeoutType) -> requests.Response:
+        """
+        Kirim GET tanpa params/body memakai PreparedRequest yang disiapkan sekali per URL,
+        sehingga merge headers/URL/environment tidak diulang setiap request.
+        Request disiapkan ulang jika headers/auth/settings session berubah (misalnya setelah login).
+        """
+        snapshot = self._session_snapshot()
+        entry = self._prepared.get(url)
+        if entry is None or entry[0] != snapshot:
+            prep = self.session.prepare_request(requests.Request("GET", url))
+            settings = self.session.merge_environment_settings(prep.url, {}, None, None, None)
+            if len(self._prepared) >= self._URL_CACHE_MAXSIZE:
+                self._prepared.clear()
+            entry = self._prepared[url] = (snapshot, prep, settings)
+        _, prep, settings = entry
+        return self.session.send(prep.copy(), timeout=timeout, **settings)
     
     def _request(
         self,
@@ -59,7 +615,8 @@ class SEVIMAClient:
         endpoint: str,
         params: Optional[Dict] = None,
         data: Optional[Dict] = None,
-        json: Optional[Dict] = None
+        json: Optional[Dict] = None,
+        timeout: Optional[TimeoutType] = None
     ) -> Dict[str, Any]:
         """
         Internal method untuk melakukan HTTP request
@@ -70,50 +627,94 @@ class SEVIMAClient:
             params: Query parameters
             data: Form data
             json: JSON body data
+            timeout: Timeout request ini, detik atau (connect, read) (default: self.timeout)
             
         Returns:
             Response JSON sebagai dictionary
             
         Raises:
-            requests.HTTPError: Jika request gagal
+            requests.HTTPError: Jika request gagal (httpx.HTTPStatusError untuk transport="httpx")
         """
-        url = f"{self.base_url}/{endpoint}"
+        if method != "GET":
+            self.cache_invalidate(endpoint)
+        url = self._url(endpoint)
+        if timeout is None:
+            timeout = self.timeout
         
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                data=data,
-                json=json,
-                timeout=30
-            )
+            if (method == "GET" and not params and data is None and json is None
+                    and self.transport == "requests" and not self.session.cookies):
+                # Session tanpa cookie: request yang sudah di-prepare selalu identik
+                response = self._send_prepared(url, timeout)
+            else:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    data=data,
+                    json=json,
+                    timeout=self._httpx_timeout(timeout) if self.transport == "httpx" else timeout
+                )
         except requests.RequestException as e:
             # Network-level error (DNS, connection, timeout, etc.)
             raise
 
-        # Raise with more context when HTTP errors occur
-        try:
-            response.raise_for_status()
-        except requests.HTTPError as e:
-            # Attach response text/json for easier debugging
-            try:
-                content = response.json()
-            except Exception:
-                content = response.text
-            e.response_content = content  # type: ignore[attr-defined]
-            raise
+        self._raise_for_status(response)
 
         # Try to return JSON; if not JSON, return raw text inside a dict
         try:
-            return response.json()
+            return _loads(response.content)
         except Exception:
             return {"raw": response.text}
     
-    def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+    def stream_items(
+        self,
+        endpoint: str,
+        json_path: str = "data.item",
+        params: Optional[Dict] = None,
+        timeout: Optional[TimeoutType] = None
+    ) -> Iterator[Any]:
+        """
+        GET satu halaman dan yield item di json_path (format prefix ijson, contoh "data.item")
+        sambil response di-download, tanpa memuat seluruh body/JSON ke memory.
+
+        Membutuhkan package ijson dan transport="requests" tanpa cache=True; jika tidak,
+        response di-parse penuh lalu item di json_path di-yield. Gabungkan dengan params
+        page/per_page untuk menelusuri semua halaman.
+        """
+        if ijson is None or self.transport != "requests" or self.cache:
+            yield from _items_at_path(self.get(endpoint, params=params, timeout=timeout), json_path)
+            return
+
+        response = self.session.request(
+            "GET",
+            self._url(endpoint),
+            params=params,
+            timeout=self.timeout if timeout is None else timeout,
+            stream=True
+        )
+        try:
+            self._raise_for_status(response)
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, json_path, use_float=True)
+        finally:
+            response.close()
+    
+    def get(self, endpoint: str, params: Optional[Dict] = None, timeout: Optional[TimeoutType] = None) -> Dict[str, Any]:
         """GET request helper"""
-        return self._request("GET", endpoint, params=params)
+        return self._request("GET", endpoint, params=params, timeout=timeout)
 
+    def _get_by_id(self, endpoint: str) -> Dict[str, Any]:
+        """GET untuk method get_*_by_id, memakai cache jika id_cache_ttl diset"""
+        if self.id_cache_ttl is None:
+            return self.get(endpoint)
+        cached = self._id_cache_get(endpoint)
+        if cached is not None:
+            return cached
+        resp = self.get(endpoint)
+        self._id_cache_put(endpoint, resp)
+        return resp
+    
     def get_with_options(
         self,
         endpoint: str,
@@ -137,42 +738,6 @@ class SEVIMAClient:
         merged = self._merge_query_params(params, page, per_page, filters, order)
         return self._request("GET", endpoint, params=merged)
 
-    def _merge_query_params(
-        self,
-        params: Optional[Dict[str, Any]] = None,
-        page: Optional[int] = None,
-        per_page: Optional[int] = None,
-        filters: Optional[Dict[str, Any]] = None,
-        order: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
-        """Build query params following SEVIMA conventions from info.txt."""
-        merged: Dict[str, Any] = {}
-        if params:
-            merged.update(params)
-
-        if page is not None:
-            merged['page'] = page
-        if per_page is not None:
-            merged['per_page'] = per_page
-
-        # Filters: translate {col: value} or {col: (value, operator)} -> f-{col}[(-operator)]=value
-        if filters:
-            for col, val in filters.items():
-                if isinstance(val, tuple) and len(val) == 2:
-                    value, operator = val
-                    key = f"f-{col}-{operator}"
-                    merged[key] = value
-                else:
-                    key = f"f-{col}"
-                    merged[key] = val
-
-        # Ordering: {col: 'asc'|'desc'} -> o-{col}=asc
-        if order:
-            for col, direction in order.items():
-                merged[f"o-{col}"] = direction
-
-        return merged
-
     def get_all_pages(
         self,
         endpoint: str,
@@ -190,10 +755,10 @@ class SEVIMAClient:
         The function attempts to detect pagination using `meta` or `urls` fields in responses.
         """
         aggregated: List[Any] = []
-        page = start_page
+        page: Optional[int] = start_page
         last_meta = None
 
-        while True:
+        while page is not None:
             resp = self.get_with_options(
                 endpoint,
                 params=params,
@@ -211,49 +776,82 @@ class SEVIMAClient:
                 return {'data': resp, 'meta': None}
 
             # store last meta if exists
-            last_meta = resp.get('meta') if isinstance(resp, dict) else None
-
-            # Determine whether to continue
-            if last_meta:
-                current = last_meta.get('current_page')
-                last_page = last_meta.get('last_page')
-                if current is not None and last_page is not None:
-                    if current >= last_page:
-                        break
-                    else:
-                        page = (current or page) + 1
-                        continue
-
-            # Fallback: if urls.next exists and is truthy, continue; else stop
-            urls = resp.get('urls') if isinstance(resp, dict) else None
-            if urls and urls.get('next'):
-                page += 1
-                continue
-
-            # If data length is less than per_page, likely last page
-            if per_page and len(resp.get('data', [])) < per_page:
-                break
-
-            # Safety: if we received empty data, stop
-            if not resp.get('data'):
-                break
-
-            # Otherwise, increment page and retry
-            page += 1
+            last_meta = resp.get('meta')
+
+            page = self._next_page(resp, page, per_page)
 
         return {'data': aggregated, 'meta': last_meta}
-    
-    def post(self, endpoint: str, params: Optional[Dict] = None, json: Optional[Dict] = None, data: Optional[Dict] = None) -> Dict[str, Any]:
+
+    def iter_items(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        order: Optional[Dict[str, str]] = None,
+        start_page: int = 1
+    ) -> Iterator[Any]:
+        """
+        Iterate semua item dari endpoint berpaginasi, halaman demi halaman.
+
+        Berbeda dengan get_all_pages, item di-yield satu per satu sehingga hanya satu
+        halaman yang disimpan di memory. Response yang bukan list-style di-yield utuh.
+        """
+        page: Optional[int] = start_page
+        while page is not None:
+            resp = self.get_with_options(
+                endpoint,
+                params=params,
+                page=page,
+                per_page=per_page,
+                filters=filters,
+                order=order,
+            )
+
+            if isinstance(resp, dict) and 'data' in resp and isinstance(resp['data'], list):
+                yield from resp['data']
+            else:
+                yield resp
+                return
+
+            page = self._next_page(resp, page, per_page)
+
+    def get_many(
+        self,
+        calls: Sequence[Tuple[str, Optional[Dict]]],
+        max_workers: int = 16
+    ) -> List[Dict[str, Any]]:
+        """
+        Jalankan banyak GET request secara paralel (ThreadPoolExecutor) lewat session yang sama.
+
+        Hanya untuk GET: request yang mengubah data (POST/PUT/DELETE) tetap dipanggil satu per satu.
+        Jumlah worker dibatasi pool_maxsize agar koneksi keep-alive tidak dibuang dari pool.
+
+        Args:
+            calls: List of (endpoint, params), contoh [("siakadcloud/v1/dosen/1/kelas", None), ...]
+            max_workers: Maksimum request bersamaan
+
+        Returns:
+            List response dengan urutan yang sama seperti calls; error pertama di-raise
+        """
+        if not calls:
+            return []
+        workers = max(1, min(max_workers, self.pool_maxsize, len(calls)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.get, endpoint, params) for endpoint, params in calls]
+            return [future.result() for future in futures]
+    
+    def post(self, endpoint: str, params: Optional[Dict] = None, json: Optional[Dict] = None, data: Optional[Dict] = None, timeout: Optional[TimeoutType] = None) -> Dict[str, Any]:
         """POST request helper (supports query params)"""
-        return self._request("POST", endpoint, params=params, json=json, data=data)
+        return self._request("POST", endpoint, params=params, json=json, data=data, timeout=timeout)
     
-    def put(self, endpoint: str, params: Optional[Dict] = None, json: Optional[Dict] = None) -> Dict[str, Any]:
+    def put(self, endpoint: str, params: Optional[Dict] = None, json: Optional[Dict] = None, timeout: Optional[TimeoutType] = None) -> Dict[str, Any]:
         """PUT request helper (supports query params)"""
-        return self._request("PUT", endpoint, params=params, json=json)
+        return self._request("PUT", endpoint, params=params, json=json, timeout=timeout)
     
-    def delete(self, endpoint: str) -> Dict[str, Any]:
+    def delete(self, endpoint: str, timeout: Optional[TimeoutType] = None) -> Dict[str, Any]:
         """DELETE request helper"""
-        return self._request("DELETE", endpoint)
+        return self._request("DELETE", endpoint, timeout=timeout)
     
     # ==================== AUTENTIKASI ====================
     
@@ -272,488 +870,367 @@ class SEVIMAClient:
             "siakadcloud/v1/user/login",
             json={"email": email, "password": password}
         )
-    
-    # ==================== DATA CBT ====================
-    
-    def get_soal_cbt(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list soal CBT"""
-        return self.get("siakadcloud/v1/soal-cbt", params=params)
-    
-    def get_soal_cbt_by_id(self, soal_id: str) -> Dict[str, Any]:
-        """Get detail soal CBT by ID"""
-        return self.get(f"siakadcloud/v1/soal-cbt/{soal_id}")
-    
-    def get_bank_soal_cbt(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list bank soal CBT"""
-        return self.get("siakadcloud/v1/bank-soal-cbt", params=params)
-    
-    def get_bank_soal_cbt_by_id(self, bank_id: str) -> Dict[str, Any]:
-        """Get detail bank soal CBT by ID"""
-        return self.get(f"siakadcloud/v1/bank-soal-cbt/{bank_id}")
-    
-    def get_soal_by_bank(self, bank_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get soal dari bank soal tertentu"""
-        return self.get(f"siakadcloud/v1/bank-soal-cbt/{bank_id}/soal", params=params)
-    
-    def get_ujian_cbt(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list ujian CBT"""
-        return self.get("siakadcloud/v1/ujian-cbt", params=params)
-    
-    def get_ujian_cbt_by_id(self, ujian_id: str) -> Dict[str, Any]:
-        """Get detail ujian CBT by ID"""
-        return self.get(f"siakadcloud/v1/ujian-cbt/{ujian_id}")
-    
-    def get_jadwal_ujian_cbt(self, ujian_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get jadwal ujian CBT"""
-        return self.get(f"siakadcloud/v1/ujian-cbt/{ujian_id}/jadwal", params=params)
-    
-    def get_peserta_ujian_cbt(self, ujian_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get peserta ujian CBT"""
-        return self.get(f"siakadcloud/v1/ujian-cbt/{ujian_id}/peserta", params=params)
-    
-    def get_jadwal_ujian_cbt_list(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list jadwal ujian CBT"""
-        return self.get("siakadcloud/v1/jadwal-ujian-cbt", params=params)
-    
-    def get_jadwal_ujian_cbt_by_id(self, jadwal_id: str) -> Dict[str, Any]:
-        """Get detail jadwal ujian CBT by ID"""
-        return self.get(f"siakadcloud/v1/jadwal-ujian-cbt/{jadwal_id}")
-    
-    def get_soal_ujian_cbt(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list soal ujian CBT"""
-        return self.get("siakadcloud/v1/soal-ujian-cbt", params=params)
-    
-    def get_soal_ujian_cbt_by_id(self, soal_id: str) -> Dict[str, Any]:
-        """Get detail soal ujian CBT by ID"""
-        return self.get(f"siakadcloud/v1/soal-ujian-cbt/{soal_id}")
-    
-    def get_peserta_ujian_cbt_list(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list peserta ujian CBT"""
-        return self.get("siakadcloud/v1/peserta-ujian-cbt", params=params)
-    
-    def get_peserta_ujian_cbt_by_id(self, peserta_id: str) -> Dict[str, Any]:
-        """Get detail peserta ujian CBT by ID"""
-        return self.get(f"siakadcloud/v1/peserta-ujian-cbt/{peserta_id}")
-    
-    def get_jawaban_peserta_ujian_cbt(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list jawaban peserta ujian CBT"""
-        return self.get("siakadcloud/v1/jawaban-peserta-ujian-cbt", params=params)
-    
-    def get_jawaban_peserta_ujian_cbt_by_id(self, jawaban_id: str) -> Dict[str, Any]:
-        """Get detail jawaban peserta ujian CBT by ID"""
-        return self.get(f"siakadcloud/v1/jawaban-peserta-ujian-cbt/{jawaban_id}")
-    
-    # ==================== DATA KEPEGAWAIAN ====================
-    
-    def get_pegawai(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list pegawai"""
-        return self.get("siakadcloud/v1/pegawai", params=params)
-    
-    def get_pegawai_by_id(self, pegawai_id: str) -> Dict[str, Any]:
-        """Get detail pegawai by ID"""
-        return self.get(f"siakadcloud/v1/pegawai/{pegawai_id}")
-    
-    def get_pegawai_cuti(self, pegawai_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get cuti pegawai"""
-        return self.get(f"siakadcloud/v1/pegawai/{pegawai_id}/cuti", params=params)
-    
-    def get_pegawai_izin(self, pegawai_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get izin pegawai"""
-        return self.get(f"siakadcloud/v1/pegawai/{pegawai_id}/izin", params=params)
-    
-    def get_presensi_dosen(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list presensi dosen"""
-        return self.get("siakadcloud/v1/presensi-dosen", params=params)
-    
-    def get_presensi_dosen_by_id(self, presensi_id: str) -> Dict[str, Any]:
-        """Get detail presensi dosen by ID"""
-        return self.get(f"siakadcloud/v1/presensi-dosen/{presensi_id}")
-    
-    def get_dosen(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list dosen"""
-        return self.get("siakadcloud/v1/dosen", params=params)
-    
-    def get_dosen_by_id(self, dosen_id: str) -> Dict[str, Any]:
-        """Get detail dosen by ID"""
-        return self.get(f"siakadcloud/v1/dosen/{dosen_id}")
-    
-    def get_dosen_penelitian(self, dosen_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get penelitian dosen"""
-        return self.get(f"siakadcloud/v1/dosen/{dosen_id}/penelitian", params=params)
-    
-    def get_dosen_edom(self, dosen_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get evaluasi dosen oleh mahasiswa (EDOM)"""
-        return self.get(f"siakadcloud/v1/dosen/{dosen_id}/edom", params=params)
-    
-    def get_dosen_perwalian(self, dosen_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get perwalian dosen"""
-        return self.get(f"siakadcloud/v1/dosen/{dosen_id}/perwalian", params=params)
-    
-    def get_dosen_kelas(self, dosen_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get kelas dosen"""
-        return self.get(f"siakadcloud/v1/dosen/{dosen_id}/kelas", params=params)
-    
-    def get_dosen_jadwal(self, dosen_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get jadwal dosen"""
-        return self.get(f"siakadcloud/v1/dosen/{dosen_id}/jadwal", params=params)
-    
-    def get_dosen_presensi(self, dosen_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get presensi dosen"""
-        return self.get(f"siakadcloud/v1/dosen/{dosen_id}/presensi-dosen", params=params)
-    
-    def get_dosen_pengabdian(self, dosen_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get pengabdian dosen"""
-        return self.get(f"siakadcloud/v1/dosen/{dosen_id}/pengabdian", params=params)
-    
-    def get_dosen_cuti(self, dosen_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get cuti dosen"""
-        return self.get(f"siakadcloud/v1/dosen/{dosen_id}/cuti", params=params)
-    
-    def get_dosen_izin(self, dosen_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get izin dosen"""
-        return self.get(f"siakadcloud/v1/dosen/{dosen_id}/izin", params=params)
-    
-    def get_dosen_publikasi(self, dosen_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get publikasi dosen"""
-        return self.get(f"siakadcloud/v1/dosen/{dosen_id}/publikasi", params=params)
-    
-    def get_dosen_paten(self, dosen_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get paten dosen"""
-        return self.get(f"siakadcloud/v1/dosen/{dosen_id}/paten", params=params)
-    
-    # ==================== RIWAYAT PENELITIAN ====================
-    
-    def get_penelitian(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list penelitian"""
-        return self.get("siakadcloud/v1/penelitian", params=params)
-    
-    def get_penelitian_by_id(self, penelitian_id: str) -> Dict[str, Any]:
-        """Get detail penelitian by ID"""
-        return self.get(f"siakadcloud/v1/penelitian/{penelitian_id}")
-    
-    def get_dokumen_penelitian(self, penelitian_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get dokumen penelitian"""
-        return self.get(f"siakadcloud/v1/penelitian/{penelitian_id}/dokumen-penelitian", params=params)
-    
-    def get_dosen_penelitian_by_id(self, penelitian_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get dosen yang terlibat dalam penelitian"""
-        return self.get(f"siakadcloud/v1/penelitian/{penelitian_id}/dosen", params=params)
-    
-    def get_paten(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list paten"""
-        return self.get("siakadcloud/v1/paten", params=params)
-    
-    def get_paten_by_id(self, paten_id: str) -> Dict[str, Any]:
-        """Get detail paten by ID"""
-        return self.get(f"siakadcloud/v1/paten/{paten_id}")
-    
-    def get_dokumen_paten(self, paten_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get dokumen paten"""
-        return self.get(f"siakadcloud/v1/paten/{paten_id}/dokumen-paten", params=params)
-    
-    def get_dosen_paten_by_id(self, paten_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get dosen yang terlibat dalam paten"""
-        return self.get(f"siakadcloud/v1/paten/{paten_id}/dosen", params=params)
-    
-    def get_dokumen_paten_list(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list dokumen paten"""
-        return self.get("siakadcloud/v1/dokumen-paten", params=params)
-    
-    def get_dokumen_paten_by_id(self, dokumen_id: str) -> Dict[str, Any]:
-        """Get detail dokumen paten by ID"""
-        return self.get(f"siakadcloud/v1/dokumen-paten/{dokumen_id}")
-    
-    def get_publikasi(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list publikasi"""
-        return self.get("siakadcloud/v1/publikasi", params=params)
-    
-    def get_publikasi_by_id(self, publikasi_id: str) -> Dict[str, Any]:
-        """Get detail publikasi by ID"""
-        return self.get(f"siakadcloud/v1/publikasi/{publikasi_id}")
-    
-    def get_dokumen_publikasi(self, publikasi_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get dokumen publikasi"""
-        return self.get(f"siakadcloud/v1/publikasi/{publikasi_id}/dokumen-publikasi", params=params)
-    
-    def get_dosen_publikasi_by_id(self, publikasi_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get dosen yang terlibat dalam publikasi"""
-        return self.get(f"siakadcloud/v1/publikasi/{publikasi_id}/dosen", params=params)
-    
-    def get_dokumen_publikasi_list(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list dokumen publikasi"""
-        return self.get("siakadcloud/v1/dokumen-publikasi", params=params)
-    
-    def get_dokumen_publikasi_by_id(self, dokumen_id: str) -> Dict[str, Any]:
-        """Get detail dokumen publikasi by ID"""
-        return self.get(f"siakadcloud/v1/dokumen-publikasi/{dokumen_id}")
-    
-    # ==================== RIWAYAT PENGABDIAN ====================
-    
-    def get_pengabdian(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list pengabdian"""
-        return self.get("siakadcloud/v1/pengabdian", params=params)
-    
-    def get_pengabdian_by_id(self, pengabdian_id: str) -> Dict[str, Any]:
-        """Get detail pengabdian by ID"""
-        return self.get(f"siakadcloud/v1/pengabdian/{pengabdian_id}")
-    
-    def get_dokumen_pengabdian(self, pengabdian_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get dokumen pengabdian"""
-        return self.get(f"siakadcloud/v1/pengabdian/{pengabdian_id}/dokumen-pengabdian", params=params)
-    
-    def get_dokumen_pengabdian_list(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list dokumen pengabdian"""
-        return self.get("siakadcloud/v1/dokumen-pengabdian", params=params)
-    
-    def get_dokumen_pengabdian_by_id(self, dokumen_id: str) -> Dict[str, Any]:
-        """Get detail dokumen pengabdian by ID"""
-        return self.get(f"siakadcloud/v1/dokumen-pengabdian/{dokumen_id}")
-    
-    # ==================== DATA KEUANGAN ====================
-    
-    def get_invoice(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list invoice"""
-        return self.get("siakadcloud/v1/invoice", params=params)
-    
-    def get_invoice_by_id(self, invoice_id: str) -> Dict[str, Any]:
-        """Get detail invoice by ID"""
-        return self.get(f"siakadcloud/v1/invoice/{invoice_id}")
-    
-    def get_pembayaran(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list pembayaran"""
-        return self.get("siakadcloud/v1/pembayaran", params=params)
-    
-    def get_pembayaran_by_id(self, pembayaran_id: str) -> Dict[str, Any]:
-        """Get detail pembayaran by ID"""
-        return self.get(f"siakadcloud/v1/pembayaran/{pembayaran_id}")
-    
-    # ==================== DATA LAINNYA ====================
-    
-    def get_konsentrasi(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list konsentrasi"""
-        return self.get("siakadcloud/v1/konsentrasi", params=params)
-    
-    def get_konsentrasi_by_id(self, konsentrasi_id: str) -> Dict[str, Any]:
-        """Get detail konsentrasi by ID"""
-        return self.get(f"siakadcloud/v1/konsentrasi/{konsentrasi_id}")
-    
-    def get_program_studi_by_konsentrasi(self, konsentrasi_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get program studi dari konsentrasi"""
-        return self.get(f"siakadcloud/v1/konsentrasi/{konsentrasi_id}/program-studi", params=params)
-    
-    def get_berkas_syarat_pendaftar(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list berkas syarat pendaftar"""
-        return self.get("siakadcloud/v1/berkas-syarat-pendaftar", params=params)
-    
-    def get_berkas_syarat_pendaftar_by_id(self, berkas_id: str) -> Dict[str, Any]:
-        """Get detail berkas syarat pendaftar by ID"""
-        return self.get(f"siakadcloud/v1/berkas-syarat-pendaftar/{berkas_id}")
-    
-    def get_dokumen_penelitian_list(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list dokumen penelitian"""
-        return self.get("siakadcloud/v1/dokumen-penelitian", params=params)
-    
-    def get_dokumen_penelitian_by_id(self, dokumen_id: str) -> Dict[str, Any]:
-        """Get detail dokumen penelitian by ID"""
-        return self.get(f"siakadcloud/v1/dokumen-penelitian/{dokumen_id}")
-    
-    # ==================== EDLink ====================
-    
-    def get_bahan_ajar(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list bahan ajar (EdLink)"""
-        return self.get("edlink/v1/bahan-ajar", params=params)
-    
-    def get_bahan_ajar_by_id(self, bahan_id: str) -> Dict[str, Any]:
-        """Get detail bahan ajar by ID"""
-        return self.get(f"edlink/v1/bahan-ajar/{bahan_id}")
-    
-    def get_kelas_edlink(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list kelas (EdLink)"""
-        return self.get("edlink/v1/kelas", params=params)
-    
-    def get_kelas_edlink_by_id(self, kelas_id: str) -> Dict[str, Any]:
-        """Get detail kelas by ID"""
-        return self.get(f"edlink/v1/kelas/{kelas_id}")
-    
-    def get_sesi(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list sesi (EdLink)"""
-        return self.get("edlink/v1/sesi", params=params)
-    
-    def get_sesi_by_id(self, sesi_id: str) -> Dict[str, Any]:
-        """Get detail sesi by ID"""
-        return self.get(f"edlink/v1/sesi/{sesi_id}")
-    
-    def get_pengajar_kelas(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list pengajar kelas (EdLink)"""
-        return self.get("edlink/v1/pengajar-kelas", params=params)
-    
-    def get_pengajar_kelas_by_id(self, pengajar_id: str) -> Dict[str, Any]:
-        """Get detail pengajar kelas by ID"""
-        return self.get(f"edlink/v1/pengajar-kelas/{pengajar_id}")
-    
-    def get_peserta_kelas(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list peserta kelas (EdLink)"""
-        return self.get("edlink/v1/peserta-kelas", params=params)
-    
-    def get_peserta_kelas_by_id(self, peserta_id: str) -> Dict[str, Any]:
-        """Get detail peserta kelas by ID"""
-        return self.get(f"edlink/v1/peserta-kelas/{peserta_id}")
-    
-    def get_presensi_kelas(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list presensi kelas (EdLink)"""
-        return self.get("edlink/v1/presensi-kelas", params=params)
-    
-    def get_presensi_kelas_by_id(self, presensi_id: str) -> Dict[str, Any]:
-        """Get detail presensi kelas by ID"""
-        return self.get(f"edlink/v1/presensi-kelas/{presensi_id}")
-    
-    def get_tugas(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list tugas (EdLink)"""
-        return self.get("edlink/v1/tugas", params=params)
-    
-    def get_tugas_by_id(self, tugas_id: str) -> Dict[str, Any]:
-        """Get detail tugas by ID"""
-        return self.get(f"edlink/v1/tugas/{tugas_id}")
-    
-    def get_soal_edlink(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list soal (EdLink)"""
-        return self.get("edlink/v1/soal", params=params)
-    
-    def get_soal_edlink_by_id(self, soal_id: str) -> Dict[str, Any]:
-        """Get detail soal by ID"""
-        return self.get(f"edlink/v1/soal/{soal_id}")
-    
-    def get_peserta_kuis(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list peserta kuis (EdLink)"""
-        return self.get("edlink/v1/peserta-kuis", params=params)
-    
-    def get_peserta_kuis_by_id(self, peserta_id: str) -> Dict[str, Any]:
-        """Get detail peserta kuis by ID"""
-        return self.get(f"edlink/v1/peserta-kuis/{peserta_id}")
-    
-    # ==================== DATA MBKM ====================
-    
-    def get_mitra_mbkm(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list mitra MBKM"""
-        return self.get("siakadcloud/v1/mitra-mbkm", params=params)
-    
-    def get_mitra_mbkm_by_id(self, mitra_id: str) -> Dict[str, Any]:
-        """Get detail mitra MBKM by ID"""
-        return self.get(f"siakadcloud/v1/mitra-mbkm/{mitra_id}")
-    
-    def get_posisi_pekerjaan_mbkm(self, mitra_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get posisi pekerjaan dari mitra MBKM"""
-        return self.get(f"siakadcloud/v1/mitra-mbkm/{mitra_id}/posisi-pekerjaan", params=params)
-    
-    def get_program_mbkm(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list program MBKM"""
-        return self.get("siakadcloud/v1/program-mbkm", params=params)
-    
-    def get_program_mbkm_by_id(self, program_id: str) -> Dict[str, Any]:
-        """Get detail program MBKM by ID"""
-        return self.get(f"siakadcloud/v1/program-mbkm/{program_id}")
-    
-    def get_peserta_mbkm(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list peserta MBKM"""
-        return self.get("siakadcloud/v1/peserta-mbkm", params=params)
-    
-    def get_peserta_mbkm_by_id(self, peserta_id: str) -> Dict[str, Any]:
-        """Get detail peserta MBKM by ID"""
-        return self.get(f"siakadcloud/v1/peserta-mbkm/{peserta_id}")
-    
-    # ==================== DATA MAHASISWA ====================
-    
-    def get_mahasiswa(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list mahasiswa"""
-        return self.get("siakadcloud/v1/mahasiswa", params=params)
-    
-    def get_mahasiswa_by_id(self, mahasiswa_id: str) -> Dict[str, Any]:
-        """Get detail mahasiswa by ID"""
-        return self.get(f"siakadcloud/v1/mahasiswa/{mahasiswa_id}")
-    
-    def get_presensi_mahasiswa(self, mahasiswa_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get presensi mahasiswa"""
-        return self.get(f"siakadcloud/v1/mahasiswa/{mahasiswa_id}/presensi", params=params)
-    
-    def get_nilai_mahasiswa(self, mahasiswa_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get nilai mahasiswa"""
-        return self.get(f"siakadcloud/v1/mahasiswa/{mahasiswa_id}/nilai", params=params)
-    
-    def get_pelanggaran_mahasiswa(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list pelanggaran mahasiswa"""
-        return self.get("siakadcloud/v1/pelanggaran-mahasiswa", params=params)
-    
-    def get_pelanggaran_mahasiswa_by_id(self, pelanggaran_id: str) -> Dict[str, Any]:
-        """Get detail pelanggaran mahasiswa by ID"""
-        return self.get(f"siakadcloud/v1/pelanggaran-mahasiswa/{pelanggaran_id}")
-    
-    def get_proporsi_nilai_mahasiswa(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list proporsi nilai mahasiswa"""
-        return self.get("siakadcloud/v1/proporsi-nilai-mahasiswa", params=params)
-    
-    def get_proporsi_nilai_mahasiswa_by_id(self, proporsi_id: str) -> Dict[str, Any]:
-        """Get detail proporsi nilai mahasiswa by ID"""
-        return self.get(f"siakadcloud/v1/proporsi-nilai-mahasiswa/{proporsi_id}")
-    
-    def get_pendaftar(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list pendaftar"""
-        return self.get("siakadcloud/v1/pendaftar", params=params)
-    
-    def get_pendaftar_by_id(self, pendaftar_id: str) -> Dict[str, Any]:
-        """Get detail pendaftar by ID"""
-        return self.get(f"siakadcloud/v1/pendaftar/{pendaftar_id}")
-    
-    def get_program_studi_pendaftar(self, pendaftar_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get program studi pendaftar"""
-        return self.get(f"siakadcloud/v1/pendaftar/{pendaftar_id}/program-studi-pendaftar", params=params)
-    
-    def get_seleksi_pendaftar(self, pendaftar_id: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get seleksi pendaftar"""
-        return self.get(f"siakadcloud/v1/pendaftar/{pendaftar_id}/seleksi", params=params)
-    
-    # ==================== DATA AKADEMIK ====================
-    
-    def get_program_studi(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list program studi"""
-        return self.get("siakadcloud/v1/program-studi", params=params)
-    
-    def get_program_studi_by_id(self, program_studi_id: str) -> Dict[str, Any]:
-        """Get detail program studi by ID"""
-        return self.get(f"siakadcloud/v1/program-studi/{program_studi_id}")
-    
-    def get_mata_kuliah(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list mata kuliah"""
-        return self.get("siakadcloud/v1/mata-kuliah", params=params)
-    
-    def get_mata_kuliah_by_id(self, mata_kuliah_id: str) -> Dict[str, Any]:
-        """Get detail mata kuliah by ID"""
-        return self.get(f"siakadcloud/v1/mata-kuliah/{mata_kuliah_id}")
-    
-    def get_kelas(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list kelas"""
-        return self.get("siakadcloud/v1/kelas", params=params)
-    
-    def get_kelas_by_id(self, kelas_id: str) -> Dict[str, Any]:
-        """Get detail kelas by ID"""
-        return self.get(f"siakadcloud/v1/kelas/{kelas_id}")
-    
-    def get_jadwal(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list jadwal"""
-        return self.get("siakadcloud/v1/jadwal", params=params)
-    
-    def get_jadwal_by_id(self, jadwal_id: str) -> Dict[str, Any]:
-        """Get detail jadwal by ID"""
-        return self.get(f"siakadcloud/v1/jadwal/{jadwal_id}")
-    
-    def get_cpmk(self, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Get list CPMK (Capaian Pembelajaran Mata Kuliah)"""
-        return self.get("siakadcloud/v1/cpmk", params=params)
-    
-    def get_cpmk_by_id(self, cpmk_id: str) -> Dict[str, Any]:
-        """Get detail CPMK by ID"""
-        return self.get(f"siakadcloud/v1/cpmk/{cpmk_id}")
 
 
+def _items_at_path(data: Any, json_path: str) -> Iterator[Any]:
+    """Yield node di json_path (prefix gaya ijson: key dipisah titik, "item" = elemen list)"""
+    nodes = [data]
+    for key in json_path.split(".") if json_path else ():
+        children: List[Any] = []
+        for node in nodes:
+            if isinstance(node, dict):
+                if key in node:
+                    children.append(node[key])
+            elif isinstance(node, list) and key == "item":
+                children.extend(node)
+        nodes = children
+    yield from nodes
+
+
+def _make_list_method(endpoint: str):
+    def method(self, params: Optional[Dict] = None):
+        return self.get(endpoint, params=params)
+    return method
+
+
+def _make_list_iter_method(endpoint: str):
+    def method(self, params: Optional[Dict] = None, per_page: Optional[int] = None):
+        return self.iter_items(endpoint, params=params, per_page=per_page)
+    return method
+
+
+# Method dengan ID di-generate dari source agar nama parameternya tetap sama dengan
+# API lama (contoh: get_dosen_by_id(dosen_id=...)), tanpa overhead *args/**kwargs
+_DETAIL_METHOD_SRC = """
+def make(template):
+    def method(self, {arg}: str):
+        return self._get_by_id(template % ({arg},))
+    return method
+"""
+
+_SUB_METHOD_SRC = """
+def make(template):
+    def method(self, {arg}: str, params: Optional[Dict] = None):
+        return self.get(template % ({arg},), params=params)
+    return method
+"""
+
+_SUB_ITER_METHOD_SRC = """
+def make(template):
+    def method(self, {arg}: str, params: Optional[Dict] = None, per_page: Optional[int] = None):
+        return self.iter_items(template % ({arg},), params=params, per_page=per_page)
+    return method
+"""
+
+
+def _make_id_method(source: str, template: str, id_param: Optional[str]):
+    """Buat method dari source template dengan parameter ID bernama id_param"""
+    if not id_param or not id_param.isidentifier():
+        raise ValueError(f"Nama parameter ID tidak valid: {id_param!r}")
+    namespace: Dict[str, Any] = {}
+    exec(source.format(arg=id_param), {"Any": Any, "Dict": Dict, "Optional": Optional}, namespace)
+    return namespace["make"](template)
+
+
+def _set_method(cls, name: str, method, doc: str, returns: Any):
+    method.__name__ = name
+    method.__qualname__ = f"{cls.__name__}.{name}"
+    method.__doc__ = doc
+    method.__annotations__["return"] = returns
+    setattr(cls, name, method)
+
+
+def _install_resource_methods(cls, returns: Any, iter_returns: Any):
+    """
+    Buat method get_* dari _RESOURCES dan pasang ke class.
+    Endpoint list dan sub-resource juga mendapat pasangan iter_* (lihat iter_items).
+    returns/iter_returns adalah return annotation method get_*/iter_* di class tersebut.
+    """
+    for name, template, id_param, doc in _RESOURCES:
+        # Endpoint di-intern agar lookup di _url_cache cukup membandingkan pointer
+        template = sys.intern(template)
+        iter_name = "iter_" + name[len("get_"):]
+        iter_doc = f"{doc} (semua halaman, di-yield per item)"
+        if "%s" not in template:
+            _set_method(cls, name, _make_list_method(template), doc, returns)
+            _set_method(cls, iter_name, _make_list_iter_method(template), iter_doc, iter_returns)
+        elif template.endswith("%s"):
+            _set_method(cls, name, _make_id_method(_DETAIL_METHOD_SRC, template, id_param), doc, returns)
+        else:
+            _set_method(cls, name, _make_id_method(_SUB_METHOD_SRC, template, id_param), doc, returns)
+            _set_method(cls, iter_name, _make_id_method(_SUB_ITER_METHOD_SRC, template, id_param), iter_doc, iter_returns)
+
+
+_install_resource_methods(SEVIMAClient, Dict[str, Any], Iterator[Any])
+
+
+class AsyncSEVIMAClient(_BaseSEVIMAClient):
+    """
+    Async client untuk SEVIMA API Platform berbasis httpx.AsyncClient
+
+    Helper yang sama dengan SEVIMAClient (get_dosen, get_dosen_by_id, dll) tersedia dan
+    mengembalikan coroutine, sehingga banyak endpoint bisa di-fetch bersamaan
+    melalui satu connection pool (HTTP/2 jika package h2 terinstall):
+
+        async with AsyncSEVIMAClient() as client:
+            penelitian, kelas = await client.gather(
+                client.get_dosen_penelitian("123"),
+                client.get_dosen_kelas("123"),
+            )
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        http2: Optional[bool] = None,
+        max_connections: int = 64,
+        max_keepalive_connections: int = 32,
+        id_cache_ttl: Optional[float] = None,
+        id_cache_maxsize: int = 10_000,
+        timeout: Optional[TimeoutType] = None
+    ):
+        """
+        Initialize async SEVIMA API Client
+
+        Args:
+            api_key: API Key (default: dari env SEVIMA_API_KEY)
+            secret_key: Secret Key (default: dari env SEVIMA_SECRET_KEY)
+            base_url: Base URL API (default: dari env SEVIMA_BASE_URL atau https://api.sevimaplatform.com)
+            http2: Gunakan HTTP/2 (default: aktif jika package h2 terinstall)
+            max_connections: Maksimum koneksi bersamaan
+            max_keepalive_connections: Maksimum koneksi keep-alive yang disimpan
+            id_cache_ttl: Cache hasil method get_*_by_id di memory selama N detik (default: nonaktif)
+            id_cache_maxsize: Maksimum entry cache get_*_by_id
+            timeout: Default timeout request, detik atau (connect, read) (default: (5, 30))
+        """
+        if httpx is None:
+            raise ImportError("AsyncSEVIMAClient membutuhkan httpx. Install dengan: pip install 'httpx[http2]'")
+        if http2 is None:
+            http2 = importlib.util.find_spec("h2") is not None
+        super().__init__(
+            api_key=api_key,
+            secret_key=secret_key,
+            base_url=base_url,
+            id_cache_ttl=id_cache_ttl,
+            id_cache_maxsize=id_cache_maxsize,
+            timeout=timeout
+        )
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        # httpx.AsyncClient dibuat saat pertama dipakai (di dalam event loop)
+        self._client: Optional["httpx.AsyncClient"] = None
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Get (atau buat) httpx.AsyncClient yang dipakai untuk semua request"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                headers=self._default_headers(),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections
+                ),
+                timeout=self._httpx_timeout(self.timeout)
+            )
+        return self._client
+
+    async def __aenter__(self) -> "AsyncSEVIMAClient":
+        self._get_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Tutup koneksi httpx.AsyncClient"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        timeout: Optional[TimeoutType] = None
+    ) -> Dict[str, Any]:
+        """
+        Internal method untuk melakukan HTTP request secara async
+
+        Raises:
+            httpx.HTTPStatusError: Jika request gagal
+        """
+        if method != "GET":
+            self.cache_invalidate(endpoint)
+        url = self._url(endpoint)
+        response = await self._get_client().request(
+            method,
+            url,
+            params=params,
+            data=data,
+            json=json,
+            timeout=self._httpx_timeout(self.timeout if timeout is None else timeout)
+        )
+
+        self._raise_for_status(response)
+
+        # Try to return JSON; if not JSON, return raw text inside a dict
+        try:
+            return _loads(response.content)
+        except Exception:
+            return {"raw": response.text}
+
+    async def get(self, endpoint: str, params: Optional[Dict] = None, timeout: Optional[TimeoutType] = None) -> Dict[str, Any]:
+        """Async version of SEVIMAClient.get"""
+        return await self._request("GET", endpoint, params=params, timeout=timeout)
+
+    async def post(self, endpoint: str, params: Optional[Dict] = None, json: Optional[Dict] = None, data: Optional[Dict] = None, timeout: Optional[TimeoutType] = None) -> Dict[str, Any]:
+        """Async version of SEVIMAClient.post"""
+        return await self._request("POST", endpoint, params=params, json=json, data=data, timeout=timeout)
+
+    async def put(self, endpoint: str, params: Optional[Dict] = None, json: Optional[Dict] = None, timeout: Optional[TimeoutType] = None) -> Dict[str, Any]:
+        """Async version of SEVIMAClient.put"""
+        return await self._request("PUT", endpoint, params=params, json=json, timeout=timeout)
+
+    async def delete(self, endpoint: str, timeout: Optional[TimeoutType] = None) -> Dict[str, Any]:
+        """Async version of SEVIMAClient.delete"""
+        return await self._request("DELETE", endpoint, timeout=timeout)
+
+    async def login(self, email: str, password: str) -> Dict[str, Any]:
+        """Async version of SEVIMAClient.login"""
+        return await self.post(
+            "siakadcloud/v1/user/login",
+            json={"email": email, "password": password}
+        )
+
+    async def get_with_options(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        order: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Async version of SEVIMAClient.get_with_options"""
+        merged = self._merge_query_params(params, page, per_page, filters, order)
+        return await self._request("GET", endpoint, params=merged)
+
+    async def get_all_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        order: Optional[Dict[str, str]] = None,
+        start_page: int = 1,
+        page_param: str = 'page'
+    ) -> Dict[str, Any]:
+        """Async version of SEVIMAClient.get_all_pages"""
+        aggregated: List[Any] = []
+        page: Optional[int] = start_page
+        last_meta = None
+
+        while page is not None:
+            resp = await self.get_with_options(
+                endpoint,
+                params=params,
+                page=page,
+                per_page=per_page,
+                filters=filters,
+                order=order,
+            )
+
+            if isinstance(resp, dict) and 'data' in resp and isinstance(resp['data'], list):
+                aggregated.extend(resp['data'])
+            else:
+                return {'data': resp, 'meta': None}
+
+            last_meta = resp.get('meta')
+
+            page = self._next_page(resp, page, per_page)
+
+        return {'data': aggregated, 'meta': last_meta}
+
+    async def iter_items(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        per_page: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        order: Optional[Dict[str, str]] = None,
+        start_page: int = 1
+    ) -> AsyncIterator[Any]:
+        """Async version of SEVIMAClient.iter_items (pakai `async for`)"""
+        page: Optional[int] = start_page
+        while page is not None:
+            resp = await self.get_with_options(
+                endpoint,
+                params=params,
+                page=page,
+                per_page=per_page,
+                filters=filters,
+                order=order,
+            )
+
+            if isinstance(resp, dict) and 'data' in resp and isinstance(resp['data'], list):
+                for item in resp['data']:
+                    yield item
+            else:
+                yield resp
+                return
+
+            page = self._next_page(resp, page, per_page)
+
+    async def _get_by_id(self, endpoint: str) -> Dict[str, Any]:
+        """Async version of SEVIMAClient._get_by_id"""
+        if self.id_cache_ttl is None:
+            return await self.get(endpoint)
+        cached = self._id_cache_get(endpoint)
+        if cached is not None:
+            return cached
+        resp = await self.get(endpoint)
+        self._id_cache_put(endpoint, resp)
+        return resp
+
+    async def get_many(
+        self,
+        calls: Sequence[Tuple[str, Optional[Dict]]],
+        max_workers: int = 16
+    ) -> List[Dict[str, Any]]:
+        """Async version of SEVIMAClient.get_many (max_workers membatasi request bersamaan)"""
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def fetch(endpoint: str, params: Optional[Dict]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get(endpoint, params=params)
+
+        return await asyncio.gather(*(fetch(endpoint, params) for endpoint, params in calls))
+
+    async def stream_items(
+        self,
+        endpoint: str,
+        json_path: str = "data.item",
+        params: Optional[Dict] = None,
+        timeout: Optional[TimeoutType] = None
+    ) -> AsyncIterator[Any]:
+        """Async version of SEVIMAClient.stream_items (response di-parse penuh, lalu item di-yield)"""
+        resp = await self.get(endpoint, params=params, timeout=timeout)
+        for item in _items_at_path(resp, json_path):
+            yield item
+
+    async def gather(self, *aws) -> List[Any]:
+        """Jalankan beberapa coroutine request secara bersamaan (asyncio.gather)"""
+        return await asyncio.gather(*aws)
+
+
+_install_resource_methods(AsyncSEVIMAClient, Awaitable[Dict[str, Any]], AsyncIterator[Any])
+
 # Example usage
 if __name__ == "__main__":
     # Initialize client (akan menggunakan env variables)
@@ -0,0 +1,276 @@
+"""
+Test SEVIMAClient tanpa jaringan: request dikirim ke adapter palsu yang mencatat
+PreparedRequest dan membalas JSON
+
+Jalankan dengan:
+    python -m unittest discover -s tests
+"""
+import inspect
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import requests
+import urllib3
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sevima_client import AsyncSEVIMAClient, SEVIMAClient, requests_cache
+
+BASE_URL = "https://api.example.test"
+
+# (nama method, parameter, endpoint) dari SEVIMAClient sebelum helper di-generate dari
+# _RESOURCES; "{}" di endpoint diganti ID yang dikirim
+RESOURCE_METHODS = [
+    ("get_soal_cbt", ("params",), "siakadcloud/v1/soal-cbt"),
+    ("get_soal_cbt_by_id", ("soal_id",), "siakadcloud/v1/soal-cbt/{}"),
+    ("get_bank_soal_cbt", ("params",), "siakadcloud/v1/bank-soal-cbt"),
+    ("get_bank_soal_cbt_by_id", ("bank_id",), "siakadcloud/v1/bank-soal-cbt/{}"),
+    ("get_soal_by_bank", ("bank_id", "params"), "siakadcloud/v1/bank-soal-cbt/{}/soal"),
+    ("get_ujian_cbt", ("params",), "siakadcloud/v1/ujian-cbt"),
+    ("get_ujian_cbt_by_id", ("ujian_id",), "siakadcloud/v1/ujian-cbt/{}"),
+    ("get_jadwal_ujian_cbt", ("ujian_id", "params"), "siakadcloud/v1/ujian-cbt/{}/jadwal"),
+    ("get_peserta_ujian_cbt", ("ujian_id", "params"), "siakadcloud/v1/ujian-cbt/{}/peserta"),
+    ("get_jadwal_ujian_cbt_list", ("params",), "siakadcloud/v1/jadwal-ujian-cbt"),
+    ("get_jadwal_ujian_cbt_by_id", ("jadwal_id",), "siakadcloud/v1/jadwal-ujian-cbt/{}"),
+    ("get_soal_ujian_cbt", ("params",), "siakadcloud/v1/soal-ujian-cbt"),
+    ("get_soal_ujian_cbt_by_id", ("soal_id",), "siakadcloud/v1/soal-ujian-cbt/{}"),
+    ("get_peserta_ujian_cbt_list", ("params",), "siakadcloud/v1/peserta-ujian-cbt"),
+    ("get_peserta_ujian_cbt_by_id", ("peserta_id",), "siakadcloud/v1/peserta-ujian-cbt/{}"),
+    ("get_jawaban_peserta_ujian_cbt", ("params",), "siakadcloud/v1/jawaban-peserta-ujian-cbt"),
+    ("get_jawaban_peserta_ujian_cbt_by_id", ("jawaban_id",), "siakadcloud/v1/jawaban-peserta-ujian-cbt/{}"),
+    ("get_pegawai", ("params",), "siakadcloud/v1/pegawai"),
+    ("get_pegawai_by_id", ("pegawai_id",), "siakadcloud/v1/pegawai/{}"),
+    ("get_pegawai_cuti", ("pegawai_id", "params"), "siakadcloud/v1/pegawai/{}/cuti"),
+    ("get_pegawai_izin", ("pegawai_id", "params"), "siakadcloud/v1/pegawai/{}/izin"),
+    ("get_presensi_dosen", ("params",), "siakadcloud/v1/presensi-dosen"),
+    ("get_presensi_dosen_by_id", ("presensi_id",), "siakadcloud/v1/presensi-dosen/{}"),
+    ("get_dosen", ("params",), "siakadcloud/v1/dosen"),
+    ("get_dosen_by_id", ("dosen_id",), "siakadcloud/v1/dosen/{}"),
+    ("get_dosen_penelitian", ("dosen_id", "params"), "siakadcloud/v1/dosen/{}/penelitian"),
+    ("get_dosen_edom", ("dosen_id", "params"), "siakadcloud/v1/dosen/{}/edom"),
+    ("get_dosen_perwalian", ("dosen_id", "params"), "siakadcloud/v1/dosen/{}/perwalian"),
+    ("get_dosen_kelas", ("dosen_id", "params"), "siakadcloud/v1/dosen/{}/kelas"),
+    ("get_dosen_jadwal", ("dosen_id", "params"), "siakadcloud/v1/dosen/{}/jadwal"),
+    ("get_dosen_presensi", ("dosen_id", "params"), "siakadcloud/v1/dosen/{}/presensi-dosen"),
+    ("get_dosen_pengabdian", ("dosen_id", "params"), "siakadcloud/v1/dosen/{}/pengabdian"),
+    ("get_dosen_cuti", ("dosen_id", "params"), "siakadcloud/v1/dosen/{}/cuti"),
+    ("get_dosen_izin", ("dosen_id", "params"), "siakadcloud/v1/dosen/{}/izin"),
+    ("get_dosen_publikasi", ("dosen_id", "params"), "siakadcloud/v1/dosen/{}/publikasi"),
+    ("get_dosen_paten", ("dosen_id", "params"), "siakadcloud/v1/dosen/{}/paten"),
+    ("get_penelitian", ("params",), "siakadcloud/v1/penelitian"),
+    ("get_penelitian_by_id", ("penelitian_id",), "siakadcloud/v1/penelitian/{}"),
+    ("get_dokumen_penelitian", ("penelitian_id", "params"), "siakadcloud/v1/penelitian/{}/dokumen-penelitian"),
+    ("get_dosen_penelitian_by_id", ("penelitian_id", "params"), "siakadcloud/v1/penelitian/{}/dosen"),
+    ("get_paten", ("params",), "siakadcloud/v1/paten"),
+    ("get_paten_by_id", ("paten_id",), "siakadcloud/v1/paten/{}"),
+    ("get_dokumen_paten", ("paten_id", "params"), "siakadcloud/v1/paten/{}/dokumen-paten"),
+    ("get_dosen_paten_by_id", ("paten_id", "params"), "siakadcloud/v1/paten/{}/dosen"),
+    ("get_dokumen_paten_list", ("params",), "siakadcloud/v1/dokumen-paten"),
+    ("get_dokumen_paten_by_id", ("dokumen_id",), "siakadcloud/v1/dokumen-paten/{}"),
+    ("get_publikasi", ("params",), "siakadcloud/v1/publikasi"),
+    ("get_publikasi_by_id", ("publikasi_id",), "siakadcloud/v1/publikasi/{}"),
+    ("get_dokumen_publikasi", ("publikasi_id", "params"), "siakadcloud/v1/publikasi/{}/dokumen-publikasi"),
+    ("get_dosen_publikasi_by_id", ("publikasi_id", "params"), "siakadcloud/v1/publikasi/{}/dosen"),
+    ("get_dokumen_publikasi_list", ("params",), "siakadcloud/v1/dokumen-publikasi"),
+    ("get_dokumen_publikasi_by_id", ("dokumen_id",), "siakadcloud/v1/dokumen-publikasi/{}"),
+    ("get_pengabdian", ("params",), "siakadcloud/v1/pengabdian"),
+    ("get_pengabdian_by_id", ("pengabdian_id",), "siakadcloud/v1/pengabdian/{}"),
+    ("get_dokumen_pengabdian", ("pengabdian_id", "params"), "siakadcloud/v1/pengabdian/{}/dokumen-pengabdian"),
+    ("get_dokumen_pengabdian_list", ("params",), "siakadcloud/v1/dokumen-pengabdian"),
+    ("get_dokumen_pengabdian_by_id", ("dokumen_id",), "siakadcloud/v1/dokumen-pengabdian/{}"),
+    ("get_invoice", ("params",), "siakadcloud/v1/invoice"),
+    ("get_invoice_by_id", ("invoice_id",), "siakadcloud/v1/invoice/{}"),
+    ("get_pembayaran", ("params",), "siakadcloud/v1/pembayaran"),
+    ("get_pembayaran_by_id", ("pembayaran_id",), "siakadcloud/v1/pembayaran/{}"),
+    ("get_konsentrasi", ("params",), "siakadcloud/v1/konsentrasi"),
+    ("get_konsentrasi_by_id", ("konsentrasi_id",), "siakadcloud/v1/konsentrasi/{}"),
+    ("get_program_studi_by_konsentrasi", ("konsentrasi_id", "params"), "siakadcloud/v1/konsentrasi/{}/program-studi"),
+    ("get_berkas_syarat_pendaftar", ("params",), "siakadcloud/v1/berkas-syarat-pendaftar"),
+    ("get_berkas_syarat_pendaftar_by_id", ("berkas_id",), "siakadcloud/v1/berkas-syarat-pendaftar/{}"),
+    ("get_dokumen_penelitian_list", ("params",), "siakadcloud/v1/dokumen-penelitian"),
+    ("get_dokumen_penelitian_by_id", ("dokumen_id",), "siakadcloud/v1/dokumen-penelitian/{}"),
+    ("get_bahan_ajar", ("params",), "edlink/v1/bahan-ajar"),
+    ("get_bahan_ajar_by_id", ("bahan_id",), "edlink/v1/bahan-ajar/{}"),
+    ("get_kelas_edlink", ("params",), "edlink/v1/kelas"),
+    ("get_kelas_edlink_by_id", ("kelas_id",), "edlink/v1/kelas/{}"),
+    ("get_sesi", ("params",), "edlink/v1/sesi"),
+    ("get_sesi_by_id", ("sesi_id",), "edlink/v1/sesi/{}"),
+    ("get_pengajar_kelas", ("params",), "edlink/v1/pengajar-kelas"),
+    ("get_pengajar_kelas_by_id", ("pengajar_id",), "edlink/v1/pengajar-kelas/{}"),
+    ("get_peserta_kelas", ("params",), "edlink/v1/peserta-kelas"),
+    ("get_peserta_kelas_by_id", ("peserta_id",), "edlink/v1/peserta-kelas/{}"),
+    ("get_presensi_kelas", ("params",), "edlink/v1/presensi-kelas"),
+    ("get_presensi_kelas_by_id", ("presensi_id",), "edlink/v1/presensi-kelas/{}"),
+    ("get_tugas", ("params",), "edlink/v1/tugas"),
+    ("get_tugas_by_id", ("tugas_id",), "edlink/v1/tugas/{}"),
+    ("get_soal_edlink", ("params",), "edlink/v1/soal"),
+    ("get_soal_edlink_by_id", ("soal_id",), "edlink/v1/soal/{}"),
+    ("get_peserta_kuis", ("params",), "edlink/v1/peserta-kuis"),
+    ("get_peserta_kuis_by_id", ("peserta_id",), "edlink/v1/peserta-kuis/{}"),
+    ("get_mitra_mbkm", ("params",), "siakadcloud/v1/mitra-mbkm"),
+    ("get_mitra_mbkm_by_id", ("mitra_id",), "siakadcloud/v1/mitra-mbkm/{}"),
+    ("get_posisi_pekerjaan_mbkm", ("mitra_id", "params"), "siakadcloud/v1/mitra-mbkm/{}/posisi-pekerjaan"),
+    ("get_program_mbkm", ("params",), "siakadcloud/v1/program-mbkm"),
+    ("get_program_mbkm_by_id", ("program_id",), "siakadcloud/v1/program-mbkm/{}"),
+    ("get_peserta_mbkm", ("params",), "siakadcloud/v1/peserta-mbkm"),
+    ("get_peserta_mbkm_by_id", ("peserta_id",), "siakadcloud/v1/peserta-mbkm/{}"),
+    ("get_mahasiswa", ("params",), "siakadcloud/v1/mahasiswa"),
+    ("get_mahasiswa_by_id", ("mahasiswa_id",), "siakadcloud/v1/mahasiswa/{}"),
+    ("get_presensi_mahasiswa", ("mahasiswa_id", "params"), "siakadcloud/v1/mahasiswa/{}/presensi"),
+    ("get_nilai_mahasiswa", ("mahasiswa_id", "params"), "siakadcloud/v1/mahasiswa/{}/nilai"),
+    ("get_pelanggaran_mahasiswa", ("params",), "siakadcloud/v1/pelanggaran-mahasiswa"),
+    ("get_pelanggaran_mahasiswa_by_id", ("pelanggaran_id",), "siakadcloud/v1/pelanggaran-mahasiswa/{}"),
+    ("get_proporsi_nilai_mahasiswa", ("params",), "siakadcloud/v1/proporsi-nilai-mahasiswa"),
+    ("get_proporsi_nilai_mahasiswa_by_id", ("proporsi_id",), "siakadcloud/v1/proporsi-nilai-mahasiswa/{}"),
+    ("get_pendaftar", ("params",), "siakadcloud/v1/pendaftar"),
+    ("get_pendaftar_by_id", ("pendaftar_id",), "siakadcloud/v1/pendaftar/{}"),
+    ("get_program_studi_pendaftar", ("pendaftar_id", "params"), "siakadcloud/v1/pendaftar/{}/program-studi-pendaftar"),
+    ("get_seleksi_pendaftar", ("pendaftar_id", "params"), "siakadcloud/v1/pendaftar/{}/seleksi"),
+    ("get_program_studi", ("params",), "siakadcloud/v1/program-studi"),
+    ("get_program_studi_by_id", ("program_studi_id",), "siakadcloud/v1/program-studi/{}"),
+    ("get_mata_kuliah", ("params",), "siakadcloud/v1/mata-kuliah"),
+    ("get_mata_kuliah_by_id", ("mata_kuliah_id",), "siakadcloud/v1/mata-kuliah/{}"),
+    ("get_kelas", ("params",), "siakadcloud/v1/kelas"),
+    ("get_kelas_by_id", ("kelas_id",), "siakadcloud/v1/kelas/{}"),
+    ("get_jadwal", ("params",), "siakadcloud/v1/jadwal"),
+    ("get_jadwal_by_id", ("jadwal_id",), "siakadcloud/v1/jadwal/{}"),
+    ("get_cpmk", ("params",), "siakadcloud/v1/cpmk"),
+    ("get_cpmk_by_id", ("cpmk_id",), "siakadcloud/v1/cpmk/{}"),
+]
+
+
+class RecordingAdapter(requests.adapters.BaseAdapter):
+    """Adapter palsu: simpan setiap request yang dikirim, balas dengan X-App-Key request tersebut"""
+
+    def __init__(self):
+        super().__init__()
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        body = json.dumps({"app_key": request.headers.get("X-App-Key")}).encode()
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        # requests-cache butuh raw response urllib3 untuk menyimpan response
+        response.raw = urllib3.HTTPResponse(
+            body=io.BytesIO(body),
+            headers=dict(response.headers),
+            status=200,
+            preload_content=False,
+            request_url=request.url
+        )
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def make_client(adapter, api_key="key", secret_key="secret", **kwargs):
+    client = SEVIMAClient(api_key=api_key, secret_key=secret_key, base_url=BASE_URL, **kwargs)
+    client.session.mount("https://", adapter)
+    return client
+
+
+class PreparedRequestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.adapter = RecordingAdapter()
+        self.client = make_client(self.adapter)
+
+    def test_get_reuses_prepared_request(self):
+        self.client.get_dosen()
+        self.client.get_dosen()
+        self.assertEqual(len(self.client._prepared), 1)
+        self.assertEqual([request.url for request in self.adapter.sent], [f"{BASE_URL}/siakadcloud/v1/dosen"] * 2)
+
+    def test_header_change_after_first_get_is_sent(self):
+        self.client.get_dosen()
+        self.client.session.headers["Authorization"] = "Bearer token"
+        self.client.session.headers["X-App-Key"] = "new-key"
+        self.assertEqual(self.client.get_dosen(), {"app_key": "new-key"})
+        self.assertEqual(self.adapter.sent[-1].headers["Authorization"], "Bearer token")
+
+    def test_auth_change_after_first_get_is_sent(self):
+        self.client.get_dosen()
+        self.client.session.auth = ("user", "pass")
+        self.client.get_dosen()
+        self.assertNotIn("Authorization", self.adapter.sent[0].headers)
+        self.assertTrue(self.adapter.sent[1].headers["Authorization"].startswith("Basic "))
+
+
+class ResourceMethodsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.adapter = RecordingAdapter()
+        self.client = make_client(self.adapter)
+
+    def test_all_resource_methods_exist(self):
+        helpers = {name for name in dir(SEVIMAClient) if name.startswith("get_")}
+        helpers -= {"get_with_options", "get_all_pages", "get_many"}
+        self.assertEqual(helpers, {name for name, _, _ in RESOURCE_METHODS})
+
+    def test_signatures(self):
+        for cls in (SEVIMAClient, AsyncSEVIMAClient):
+            for name, params, _ in RESOURCE_METHODS:
+                with self.subTest(cls=cls.__name__, method=name):
+                    signature = inspect.signature(getattr(cls, name))
+                    self.assertEqual(tuple(signature.parameters)[1:], params)
+
+    def test_endpoints(self):
+        for name, params, endpoint in RESOURCE_METHODS:
+            with self.subTest(method=name):
+                # ID dikirim sebagai keyword agar nama parameter lama ikut teruji
+                kwargs = {param: "ID-1" for param in params if param != "params"}
+                expected = f"{BASE_URL}/{endpoint.format('ID-1')}"
+                if "params" in params:
+                    kwargs["params"] = {"page": "2"}
+                    expected += "?page=2"
+                getattr(self.client, name)(**kwargs)
+                self.assertEqual(self.adapter.sent[-1].url, expected)
+
+
+@unittest.skipUnless(requests_cache is not None, "requests-cache tidak terinstall")
+class ResponseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache_name = os.path.join(self.cache_dir, "sevima_cache")
+        self.adapter = RecordingAdapter()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def make_cached_client(self, api_key="key", secret_key="secret"):
+        return make_client(self.adapter, api_key, secret_key, cache=True, cache_name=self.cache_name)
+
+    def test_same_credentials_share_cache(self):
+        self.assertEqual(self.make_cached_client().get_dosen(), {"app_key": "key"})
+        self.assertEqual(self.make_cached_client().get_dosen(), {"app_key": "key"})
+        self.assertEqual(len(self.adapter.sent), 1)
+
+    def test_cache_key_differs_by_credentials(self):
+        clients = [
+            self.make_cached_client("key", "secret"),
+            self.make_cached_client("other", "secret"),
+            self.make_cached_client("key", "other"),
+        ]
+        request = requests.Request("GET", f"{BASE_URL}/siakadcloud/v1/dosen")
+        keys = {client.session.cache.create_key(client.session.prepare_request(request)) for client in clients}
+        self.assertEqual(len(keys), len(clients))
+
+    def test_other_credentials_are_not_served_cached_response(self):
+        self.assertEqual(self.make_cached_client("key").get_dosen(), {"app_key": "key"})
+        self.assertEqual(self.make_cached_client("other").get_dosen(), {"app_key": "other"})
+        self.assertEqual(len(self.adapter.sent), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
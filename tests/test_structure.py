@@ -0,0 +1,106 @@
+"""
+Test _structure.extract_keys_only terhadap implementasi rekursif awal (dari app.py)
+
+Jalankan dengan:
+    python -m unittest discover -s tests
+"""
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from _structure import extract_keys_only
+
+
+def recursive_extract_keys_only(data):
+    """Implementasi rekursif awal, dipakai sebagai referensi output"""
+    if isinstance(data, dict):
+        result = {}
+        for key, value in data.items():
+            if isinstance(value, dict):
+                result[key] = recursive_extract_keys_only(value)
+            elif isinstance(value, list):
+                result[key] = recursive_extract_keys_only(value)
+            else:
+                result[key] = None
+        return result
+    elif isinstance(data, list):
+        if len(data) > 0:
+            first_item = recursive_extract_keys_only(data[0])
+            return [first_item] if first_item is not None else []
+        else:
+            return []
+    else:
+        return None
+
+
+class ExtractKeysOnlyTest(unittest.TestCase):
+
+    def assertSameAsRecursive(self, data):
+        expected = recursive_extract_keys_only(data)
+        result = extract_keys_only(data)
+        self.assertEqual(result, expected)
+        # Urutan key juga harus sama (response.json ditulis sesuai urutan ini)
+        self.assertEqual(repr(result), repr(expected))
+
+    def test_primitive(self):
+        for value in (None, 1, 2.5, "x", True):
+            self.assertSameAsRecursive(value)
+
+    def test_flat_dict_fast_path(self):
+        self.assertSameAsRecursive({"id": "123", "name": "John", "aktif": True, "nilai": None})
+        self.assertSameAsRecursive({})
+
+    def test_nested_dict(self):
+        self.assertSameAsRecursive({"data": {"id": "123", "name": "John", "attrs": {"age": 30}}})
+        self.assertSameAsRecursive({"data": {"attributes": {"a": 1}, "relationships": {"r": {"data": None}}}})
+
+    def test_list_of_primitives(self):
+        self.assertSameAsRecursive({"tags": ["a", "b"], "ids": [1, 2, 3]})
+        self.assertEqual(extract_keys_only({"tags": ["a", "b"]}), {"tags": []})
+
+    def test_empty_list(self):
+        self.assertSameAsRecursive([])
+        self.assertSameAsRecursive({"data": [], "meta": {"total": 0}})
+
+    def test_list_of_lists(self):
+        self.assertSameAsRecursive([[{"a": 1}], [{"b": 2}]])
+        self.assertSameAsRecursive({"matrix": [[1, 2], [3, 4]]})
+        self.assertSameAsRecursive({"matrix": [[], [1]]})
+        self.assertSameAsRecursive([[[{"x": {"y": [1]}}]]])
+
+    def test_list_uses_first_item(self):
+        self.assertSameAsRecursive({"data": [{"id": 1, "n": {"a": 1}}, {"id": 2, "other": 3}]})
+
+    def test_random_trees(self):
+        rng = random.Random(1)
+
+        def generate(depth=0):
+            r = rng.random()
+            if depth > 5 or r < 0.3:
+                return rng.choice([1, "x", None, True, 2.5])
+            if r < 0.65:
+                return {f"k{i}": generate(depth + 1) for i in range(rng.randint(0, 5))}
+            return [generate(depth + 1) for _ in range(rng.randint(0, 3))]
+
+        for _ in range(2000):
+            self.assertSameAsRecursive(generate())
+
+    def test_deep_nesting_without_recursion_limit(self):
+        data = {}
+        node = data
+        for _ in range(sys.getrecursionlimit() * 2):
+            node["child"] = {}
+            node = node["child"]
+        result = extract_keys_only(data)
+        depth = 0
+        while result:
+            result = result["child"]
+            depth += 1
+        self.assertEqual(depth, sys.getrecursionlimit() * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()